@@ -2,13 +2,183 @@
 
 from datetime import datetime, timedelta
 from decimal import Decimal
-from django.db.models import Avg, Count, Sum, Q
+from django.db.models import Avg, Count, Min, Prefetch, Sum, Q
 from django.utils import timezone
-import math
+import bisect
+import functools
+import numpy as np
 from .models import Customer, PaymentHistory, CreditCard, Loan, BankAccount, CibilScore
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba is an optional accelerator
+    njit = None
+    prange = range
+
+# Precomputed sigmoid + power curve over [0, 1] (1025 samples). The mapping
+# is identical for every customer and the final score is int-truncated, so
+# table resolution is plenty; this avoids an exp and a pow per conversion.
+_CURVE_XS = np.linspace(0.0, 1.0, 1025)
+_CURVE_SIG = 1.0 / (1.0 + np.exp(-8.0 * (_CURVE_XS - 0.5)))
+_CURVE = np.where(_CURVE_XS < 0.5, _CURVE_SIG ** 1.2, _CURVE_SIG ** 0.9)
+
+
+def _convert_scale_kernel(score_0_100, min_score, max_score):
+    """
+    Map a 0-100 score onto [min_score, max_score] via sigmoid + power curve
+    """
+    normalized_score = score_0_100
+    if normalized_score < 0.0:
+        normalized_score = 0.0
+    elif normalized_score > 100.0:
+        normalized_score = 100.0
+    normalized_score /= 100.0
+
+    # Table lookup replaces the sigmoid exp and power pow calls
+    power_score = _CURVE[int(normalized_score * 1024.0)]
+
+    final_score = int(min_score + power_score * (max_score - min_score))
+    if final_score < min_score:
+        return min_score
+    if final_score > max_score:
+        return max_score
+    return final_score
+
+
+def _score_batch_kernel(base_scores, util_ratio, cc_active, cc_limit, years,
+                        diversity_scores, consistency_scores, growth_scores,
+                        base_min, base_max, curve):
+    """
+    Fused behavioral-adjustment + dynamic-range + scale-conversion loop.
+
+    Pure scalar arithmetic per customer, so numba parallelizes the loop
+    across cores when available; mirrors the scalar adjustment methods.
+    """
+    n = base_scores.shape[0]
+    final_scores = np.empty(n, np.int64)
+    for i in prange(n):
+        # Behavioral multiplier
+        multiplier = 1.0
+        if cc_active[i] > 0 and cc_limit[i] > 0:
+            utilization = util_ratio[i]
+            if utilization < 0.05 and cc_limit[i] > 100000:
+                multiplier *= 0.85
+            elif utilization < 0.02 and cc_limit[i] > 50000:
+                multiplier *= 0.92
+            elif utilization < 0.01 and cc_limit[i] > 25000:
+                multiplier *= 0.95
+        diversity = diversity_scores[i]
+        if diversity >= 80:
+            multiplier *= 1.05
+        elif diversity >= 60:
+            multiplier *= 1.02
+        elif diversity < 30:
+            multiplier *= 0.95
+        consistency = consistency_scores[i]
+        if consistency >= 90:
+            multiplier *= 1.03
+        elif consistency >= 75:
+            multiplier *= 1.01
+        elif consistency < 50:
+            multiplier *= 0.97
+        growth = growth_scores[i]
+        if 70 <= growth <= 85:
+            multiplier *= 1.02
+        elif growth > 90 or growth < 30:
+            multiplier *= 0.98
+        multiplier = int(multiplier * 10000.0 + 0.5) / 10000.0
+
+        # Dynamic score range
+        range_mult = 1.0
+        if years[i] >= 10:
+            range_mult += 0.2
+        elif years[i] >= 5:
+            range_mult += 0.1
+        elif years[i] < 1:
+            range_mult -= 0.1
+        if cc_limit[i] > 500000:
+            range_mult += 0.15
+        elif cc_limit[i] > 100000:
+            range_mult += 0.05
+        elif cc_limit[i] < 25000:
+            range_mult -= 0.05
+        if diversity >= 80:
+            range_mult += 0.1
+        elif diversity < 40:
+            range_mult -= 0.05
+        expansion = (base_max - base_min) * (range_mult - 1.0)
+        dynamic_min = int(base_min - expansion / 2.0)
+        if dynamic_min < 150:
+            dynamic_min = 150
+        dynamic_max = int(base_max + expansion / 2.0)
+        if dynamic_max > 1200:
+            dynamic_max = 1200
+
+        # Scale conversion via the shared curve table
+        adjusted = base_scores[i] * multiplier
+        if adjusted < 0.0:
+            adjusted = 0.0
+        elif adjusted > 100.0:
+            adjusted = 100.0
+        powered = curve[int(adjusted / 100.0 * 1024.0)]
+        final = int(dynamic_min + powered * (dynamic_max - dynamic_min))
+        if final < dynamic_min:
+            final = dynamic_min
+        elif final > dynamic_max:
+            final = dynamic_max
+        final_scores[i] = final
+    return final_scores
+
+
+if njit is not None:
+    _convert_scale_kernel = njit(cache=True, fastmath=True)(_convert_scale_kernel)
+    _score_batch_kernel = njit(parallel=True, cache=True, fastmath=True)(_score_batch_kernel)
+
+# Score band thresholds (ascending) with the score for each resulting band.
+# Looked up via bisect instead of walking an if/elif ladder.
+_UTIL_THRESHOLDS = (0.05, 0.10, 0.30, 0.50, 0.70, 0.90)
+_UTIL_SCORES = (95.0, 100.0, 85.0, 65.0, 45.0, 25.0, 10.0)
+
+_HISTORY_THRESHOLDS = (1, 3, 5, 7, 10)  # years of credit history
+_HISTORY_SCORES = (25.0, 40.0, 55.0, 70.0, 85.0, 100.0)
+
+_NEW_CREDIT_THRESHOLDS = (0, 1, 2, 4)  # recent accounts opened
+_NEW_CREDIT_SCORES = (100.0, 80.0, 60.0, 40.0, 20.0)
+
+# Rating per 10-point decade of a 0-100 score, indexed by score // 10
+_RATINGS = (
+    'Poor', 'Poor', 'Poor', 'Poor', 'Poor',
+    'Average', 'Fair', 'Good', 'Very Good', 'Excellent', 'Excellent',
+)
+
+_LATE_STATUSES = ['LATE_1_30', 'LATE_31_60', 'LATE_61_90', 'LATE_90_PLUS']
+
+
+def _band_lookup(values, thresholds, scores, side='left'):
+    """Vectorized equivalent of the scalar bisect band lookups"""
+    idx = np.searchsorted(np.asarray(thresholds), values, side=side)
+    return np.asarray(scores)[idx]
+
+
+def _memoize(method):
+    """
+    Cache a no-argument method's result on the instance for one calculation
+    """
+    @functools.wraps(method)
+    def wrapper(self):
+        name = method.__name__
+        if name not in self._cache:
+            self._cache[name] = method(self)
+        return self._cache[name]
+    return wrapper
+
+
 class DynamicCibilScoreCalculator:
-    
+
+    # Canonical factor order for array-based math
+    _FACTORS = ('payment_history', 'credit_utilization', 'credit_history_length',
+                'credit_mix', 'new_credit')
+
     def __init__(self, customer, custom_weights=None):
         self.customer = customer
         
@@ -27,10 +197,63 @@ class DynamicCibilScoreCalculator:
         else:
             self.score_factors = self.default_score_factors.copy()
         
+        # Weight vector aligned with _FACTORS for array-based math, plus a
+        # plain tuple for scalar paths that would otherwise probe the dict
+        self.weights = np.array(
+            [self.score_factors[factor] for factor in self._FACTORS],
+            dtype=np.float64
+        )
+        self._w = tuple(self.weights.tolist())
+
         # Dynamic score range - adapts based on credit profile
         self.base_min_score = 200
         self.base_max_score = 1000
-    
+
+        # Snapshot "now" once so every factor sees the same reference time
+        self._now = timezone.now()
+        self._today = self._now.date()
+        self._six_months_ago = self._now - timedelta(days=180)
+        self._one_year_ago = self._now - timedelta(days=365)
+
+        # Lazily populated credit card totals (single combined query)
+        self._cc_totals = None
+
+        # Per-calculation cache for memoized helper methods
+        self._cache = {}
+
+    @classmethod
+    def for_customer_id(cls, customer_id, custom_weights=None):
+        """
+        Build a calculator from a customer fetched with its related data.
+
+        The factor helpers aggregate in the database, but callers that
+        serialize the customer afterwards walk the related sets; fetching
+        them up front keeps those reads from issuing one query each.
+        Payment history is left to the SQL aggregates since it can be
+        arbitrarily large.
+        """
+        customer = Customer.objects.prefetch_related(
+            Prefetch('credit_cards',
+                     queryset=CreditCard.objects.filter(is_active=True)),
+            'loans',
+            'bank_accounts'
+        ).get(pk=customer_id)
+        return cls(customer, custom_weights)
+
+    def _get_cc_totals(self):
+        """
+        Get credit limit, balance and card count for active cards in one query
+        """
+        if self._cc_totals is None:
+            self._cc_totals = CreditCard.objects.filter(
+                customer=self.customer, is_active=True
+            ).aggregate(
+                limit=Sum('credit_limit'),
+                balance=Sum('current_balance'),
+                cnt=Count('id')
+            )
+        return self._cc_totals
+
     def _validate_and_normalize_weights(self, custom_weights):
         """
         Validate and normalize user-provided weights to ensure they sum to 100%
@@ -60,29 +283,19 @@ class DynamicCibilScoreCalculator:
         """
         Calculate CIBIL score with dynamic scaling and user-defined weights
         """
-        # Calculate individual factor scores
-        payment_history_score = self._calculate_payment_history_score()
-        credit_utilization_score = self._calculate_credit_utilization_score()
-        credit_history_length_score = self._calculate_credit_history_length_score()
-        credit_mix_score = self._calculate_credit_mix_score()
-        new_credit_score = self._calculate_new_credit_score()
-        
-        # Calculate weighted contributions using custom weights
-        payment_history_contribution = payment_history_score * self.score_factors['payment_history']
-        credit_utilization_contribution = credit_utilization_score * self.score_factors['credit_utilization']
-        credit_history_length_contribution = credit_history_length_score * self.score_factors['credit_history_length']
-        credit_mix_contribution = credit_mix_score * self.score_factors['credit_mix']
-        new_credit_contribution = new_credit_score * self.score_factors['new_credit']
-        
-        # Calculate base weighted score (0-100 scale)
-        base_final_score = (
-            payment_history_contribution +
-            credit_utilization_contribution +
-            credit_history_length_contribution +
-            credit_mix_contribution +
-            new_credit_contribution
-        )
-        
+        # Start from a clean cache so memoized helpers see fresh data
+        self._cache.clear()
+        self._cc_totals = None
+
+        # Calculate individual factor scores (one array in _FACTORS order)
+        factor_scores = self._get_factor_scores()
+        (payment_history_score, credit_utilization_score,
+         credit_history_length_score, credit_mix_score,
+         new_credit_score) = factor_scores.tolist()
+
+        # Calculate base weighted score (0-100 scale) as a single dot product
+        base_final_score = float(np.dot(factor_scores, self.weights))
+
         # Apply behavioral adjustments
         behavioral_multiplier = self._get_behavioral_adjustments()
         adjusted_final_score = base_final_score * behavioral_multiplier
@@ -121,26 +334,329 @@ class DynamicCibilScoreCalculator:
             'custom_weights_used': self.score_factors
         }
 
+    # BATCH SCORING
+
+    @classmethod
+    def bulk_score(cls, customer_ids, custom_weights=None, commit=True):
+        """
+        Score many customers in one vectorized pass.
+
+        Loads per-customer aggregates with one query per model instead of
+        ~15 queries per customer, then computes every factor score,
+        behavioral adjustment and scale conversion over contiguous NumPy
+        arrays. Returns the new CibilScore objects in customer_ids order.
+        """
+        customer_ids = list(customer_ids)
+        n = len(customer_ids)
+        if n == 0:
+            return []
+
+        index = {cid: i for i, cid in enumerate(customer_ids)}
+        now = timezone.now()
+        today = now.date()
+        six_months_ago = now - timedelta(days=180)
+        one_year_ago = now - timedelta(days=365)
+
+        # Step 1: bulk-load aggregates, one GROUP BY query per model
+        ph_total = np.zeros(n)
+        ph_on_time = np.zeros(n)
+        ph_late = np.zeros(n)
+        ph_missed = np.zeros(n)
+        ph_recent = np.zeros(n)
+        ph_recent_on_time = np.zeros(n)
+        payment_rows = PaymentHistory.objects.filter(
+            customer_id__in=customer_ids
+        ).values('customer_id').annotate(
+            total=Count('id'),
+            on_time=Count('id', filter=Q(payment_status='ON_TIME')),
+            late=Count('id', filter=Q(payment_status__in=_LATE_STATUSES)),
+            missed=Count('id', filter=Q(payment_status__in=['MISSED', 'DEFAULTED'])),
+            recent=Count('id', filter=Q(payment_date__gte=six_months_ago)),
+            recent_on_time=Count('id', filter=Q(
+                payment_date__gte=six_months_ago, payment_status='ON_TIME'))
+        )
+        for row in payment_rows.iterator(chunk_size=500):
+            i = index[row['customer_id']]
+            ph_total[i] = row['total']
+            ph_on_time[i] = row['on_time']
+            ph_late[i] = row['late']
+            ph_missed[i] = row['missed']
+            ph_recent[i] = row['recent']
+            ph_recent_on_time[i] = row['recent_on_time']
+
+        cc_limit = np.zeros(n)
+        cc_balance = np.zeros(n)
+        cc_active = np.zeros(n)
+        cc_total = np.zeros(n)
+        cc_recent = np.zeros(n)
+        cc_old_limit = np.zeros(n)
+        oldest_dates = [None] * n
+        card_rows = CreditCard.objects.filter(
+            customer_id__in=customer_ids
+        ).values('customer_id').annotate(
+            total=Count('id'),
+            active=Count('id', filter=Q(is_active=True)),
+            limit=Sum('credit_limit', filter=Q(is_active=True)),
+            balance=Sum('current_balance', filter=Q(is_active=True)),
+            recent=Count('id', filter=Q(created_at__gte=six_months_ago)),
+            old_limit=Sum('credit_limit', filter=Q(created_at__lte=one_year_ago)),
+            oldest=Min('card_issued_date')
+        )
+        for row in card_rows.iterator(chunk_size=500):
+            i = index[row['customer_id']]
+            cc_total[i] = row['total']
+            cc_active[i] = row['active']
+            cc_limit[i] = float(row['limit'] or 0)
+            cc_balance[i] = float(row['balance'] or 0)
+            cc_recent[i] = row['recent']
+            cc_old_limit[i] = float(row['old_limit'] or 0)
+            oldest_dates[i] = row['oldest']
+
+        loan_total = np.zeros(n)
+        loan_active = np.zeros(n)
+        loan_recent = np.zeros(n)
+        loan_outstanding = np.zeros(n)
+        loan_rows = Loan.objects.filter(
+            customer_id__in=customer_ids
+        ).values('customer_id').annotate(
+            total=Count('id'),
+            active=Count('id', filter=Q(status='ACTIVE')),
+            recent=Count('id', filter=Q(created_at__gte=six_months_ago)),
+            outstanding=Sum('outstanding_amount', filter=Q(status='ACTIVE')),
+            oldest=Min('loan_start_date')
+        )
+        for row in loan_rows.iterator(chunk_size=500):
+            i = index[row['customer_id']]
+            loan_total[i] = row['total']
+            loan_active[i] = row['active']
+            loan_recent[i] = row['recent']
+            loan_outstanding[i] = float(row['outstanding'] or 0)
+            if row['oldest'] and (oldest_dates[i] is None or row['oldest'] < oldest_dates[i]):
+                oldest_dates[i] = row['oldest']
+
+        ba_total = np.zeros(n)
+        ba_active = np.zeros(n)
+        account_rows = BankAccount.objects.filter(
+            customer_id__in=customer_ids
+        ).values('customer_id').annotate(
+            total=Count('id'),
+            active=Count('id', filter=Q(is_active=True)),
+            oldest=Min('account_opened_date')
+        )
+        for row in account_rows.iterator(chunk_size=500):
+            i = index[row['customer_id']]
+            ba_total[i] = row['total']
+            ba_active[i] = row['active']
+            if row['oldest'] and (oldest_dates[i] is None or row['oldest'] < oldest_dates[i]):
+                oldest_dates[i] = row['oldest']
+
+        has_home = np.zeros(n)
+        has_car = np.zeros(n)
+        has_personal = np.zeros(n)
+        loan_type_count = np.zeros(n)
+        type_rows = Loan.objects.filter(
+            customer_id__in=customer_ids, status='ACTIVE'
+        ).values_list('customer_id', 'loan_type').distinct()
+        for customer_id, loan_type in type_rows:
+            i = index[customer_id]
+            loan_type_count[i] += 1
+            if loan_type == 'HOME_LOAN':
+                has_home[i] = 1
+            elif loan_type == 'CAR_LOAN':
+                has_car[i] = 1
+            elif loan_type == 'PERSONAL_LOAN':
+                has_personal[i] = 1
+
+        # Step 2: factor scores with NumPy broadcasting
+        years = np.array([
+            (today - d).days / 365.25 if d is not None else 0.0
+            for d in oldest_dates
+        ])
+        has_history = np.array([d is not None for d in oldest_dates])
+
+        safe_total = np.maximum(ph_total, 1)
+        raw_payment = (
+            ph_on_time / safe_total * 100
+            - ph_late / safe_total * 30
+            - ph_missed / safe_total * 50
+        )
+        np.clip(raw_payment, 0.0, 100.0, out=raw_payment)
+        payment_scores = np.where(ph_total == 0, 50.0, np.round(raw_payment, 2))
+
+        util_ratio = np.where(cc_limit > 0, cc_balance / np.maximum(cc_limit, 1), 0.0)
+        utilization_scores = np.where(
+            (cc_active == 0) | (cc_limit == 0),
+            70.0,
+            _band_lookup(util_ratio, _UTIL_THRESHOLDS, _UTIL_SCORES)
+        )
+
+        history_scores = np.where(
+            has_history,
+            _band_lookup(years, _HISTORY_THRESHOLDS, _HISTORY_SCORES, side='right'),
+            30.0
+        )
+
+        mix_scores = np.minimum(
+            100.0,
+            30 * (cc_active > 0) + 20 * (ba_active > 0)
+            + 25 * has_home + 15 * has_car + 10 * has_personal
+        )
+
+        new_credit_scores = _band_lookup(
+            loan_recent + cc_recent, _NEW_CREDIT_THRESHOLDS, _NEW_CREDIT_SCORES)
+
+        # Step 3: weighted base score as one matrix product
+        config = cls(None, custom_weights)
+        weights = config.weights
+        factor_matrix = np.stack([
+            payment_scores, utilization_scores, history_scores,
+            mix_scores, new_credit_scores
+        ])
+        base_scores = weights @ factor_matrix
+
+        # Inputs to the behavioral adjustments
+        diversity_scores = np.minimum(
+            100.0,
+            25 * (cc_active > 0) + 15 * loan_type_count + 20 * (ba_active > 0)
+        )
+        consistency_scores = np.where(
+            ph_recent < 3,
+            50.0,
+            ph_recent_on_time / np.maximum(ph_recent, 1) * 100
+        )
+        growth_rate = (cc_limit - cc_old_limit) / np.maximum(cc_old_limit, 1)
+        growth_scores = np.select(
+            [
+                cc_old_limit <= 0,
+                (growth_rate >= 0.10) & (growth_rate <= 0.50),
+                ((growth_rate >= 0.05) & (growth_rate < 0.10))
+                | ((growth_rate > 0.50) & (growth_rate <= 0.80)),
+            ],
+            [60.0, 85.0, 70.0],
+            default=50.0
+        )
+
+        if njit is not None:
+            # Fused multi-core kernel: adjustments, ranges and conversion
+            final_scores = _score_batch_kernel(
+                base_scores, util_ratio, cc_active, cc_limit, years,
+                diversity_scores, consistency_scores, growth_scores,
+                float(config.base_min_score), float(config.base_max_score),
+                _CURVE
+            )
+        else:
+            # NumPy fallback mirroring the kernel
+            underutilization = np.select(
+                [
+                    (util_ratio < 0.05) & (cc_limit > 100000),
+                    (util_ratio < 0.02) & (cc_limit > 50000),
+                    (util_ratio < 0.01) & (cc_limit > 25000),
+                ],
+                [0.85, 0.92, 0.95],
+                default=1.0
+            )
+            underutilization = np.where(
+                (cc_active == 0) | (cc_limit == 0), 1.0, underutilization)
+            diversity_adj = np.select(
+                [diversity_scores >= 80, diversity_scores >= 60, diversity_scores < 30],
+                [1.05, 1.02, 0.95],
+                default=1.0
+            )
+            consistency_adj = np.select(
+                [consistency_scores >= 90, consistency_scores >= 75,
+                 consistency_scores < 50],
+                [1.03, 1.01, 0.97],
+                default=1.0
+            )
+            growth_adj = np.select(
+                [(growth_scores >= 70) & (growth_scores <= 85),
+                 (growth_scores > 90) | (growth_scores < 30)],
+                [1.02, 0.98],
+                default=1.0
+            )
+            multipliers = np.round(
+                underutilization * diversity_adj * consistency_adj * growth_adj, 4)
+
+            # Dynamic score ranges
+            range_mult = 1.0 + (
+                np.select([years >= 10, years >= 5, years < 1],
+                          [0.2, 0.1, -0.1], default=0.0)
+                + np.select([cc_limit > 500000, cc_limit > 100000, cc_limit < 25000],
+                            [0.15, 0.05, -0.05], default=0.0)
+                + np.select([diversity_scores >= 80, diversity_scores < 40],
+                            [0.1, -0.05], default=0.0)
+            )
+            base_width = config.base_max_score - config.base_min_score
+            range_expansion = base_width * (range_mult - 1)
+            dynamic_min = np.maximum(
+                150, (config.base_min_score - range_expansion / 2).astype(int))
+            dynamic_max = np.minimum(
+                1200, (config.base_max_score + range_expansion / 2).astype(int))
+
+            # Sigmoid + power conversion to the dynamic scale
+            normalized = np.clip(base_scores * multipliers, 0, 100) / 100.0
+            powered = _CURVE[(normalized * 1024).astype(int)]
+            final_scores = dynamic_min + (powered * (dynamic_max - dynamic_min)).astype(int)
+            final_scores = np.clip(final_scores, dynamic_min, dynamic_max)
+
+        # Build the score rows
+        total_outstanding = cc_balance + loan_outstanding
+        new_scores = []
+        for i, customer_id in enumerate(customer_ids):
+            new_scores.append(CibilScore(
+                customer_id=customer_id,
+                score=int(final_scores[i]),
+                payment_history_score=round(float(payment_scores[i]), 2),
+                credit_utilization_score=round(float(utilization_scores[i]), 2),
+                credit_history_length_score=round(float(history_scores[i]), 2),
+                credit_mix_score=round(float(mix_scores[i]), 2),
+                new_credit_score=round(float(new_credit_scores[i]), 2),
+                total_accounts=int(loan_total[i] + cc_total[i] + ba_total[i]),
+                active_accounts=int(loan_active[i] + cc_active[i] + ba_active[i]),
+                total_credit_limit=round(float(cc_limit[i]), 2),
+                total_outstanding=round(float(total_outstanding[i]), 2),
+                credit_utilization_ratio=round(float(util_ratio[i]) * 100, 2)
+            ))
+
+        if commit:
+            # One UPDATE + one bulk INSERT instead of 2N per-row round-trips
+            CibilScore.bulk_create_latest(new_scores, batch_size=500)
+
+        return new_scores
+
     # CORE CALCULATION METHODS - These were missing!
 
+    def _get_factor_scores(self):
+        """Get the five factor scores packed as a float64 array in _FACTORS order"""
+        return np.array([
+            self._calculate_payment_history_score(),
+            self._calculate_credit_utilization_score(),
+            self._calculate_credit_history_length_score(),
+            self._calculate_credit_mix_score(),
+            self._calculate_new_credit_score()
+        ], dtype=np.float64)
+
+    @_memoize
     def _calculate_payment_history_score(self):
         """
         Calculate payment history score based on payment patterns
         """
-        payments = PaymentHistory.objects.filter(customer=self.customer)
-        
-        if not payments.exists():
+        # Single query with conditional counts instead of one query per status
+        stats = PaymentHistory.objects.filter(customer=self.customer).aggregate(
+            total=Count('id'),
+            on_time=Count('id', filter=Q(payment_status='ON_TIME')),
+            late=Count('id', filter=Q(payment_status__in=_LATE_STATUSES)),
+            missed=Count('id', filter=Q(payment_status__in=['MISSED', 'DEFAULTED']))
+        )
+
+        total_payments = stats['total']
+        if total_payments == 0:
             return 50.0  # Neutral score if no history
-        
-        total_payments = payments.count()
-        on_time_payments = payments.filter(payment_status='ON_TIME').count()
-        late_payments = payments.filter(
-            payment_status__in=['LATE_1_30', 'LATE_31_60', 'LATE_61_90', 'LATE_90_PLUS']
-        ).count()
-        missed_payments = payments.filter(
-            payment_status__in=['MISSED', 'DEFAULTED']
-        ).count()
-        
+
+        on_time_payments = stats['on_time']
+        late_payments = stats['late']
+        missed_payments = stats['missed']
+
         # Calculate score based on payment patterns
         on_time_ratio = on_time_payments / total_payments
         late_ratio = late_payments / total_payments
@@ -150,90 +666,72 @@ class DynamicCibilScoreCalculator:
         base_score = on_time_ratio * 100
         late_penalty = late_ratio * 30
         missed_penalty = missed_ratio * 50
-        
-        score = max(0, base_score - late_penalty - missed_penalty)
+
+        score = base_score - late_penalty - missed_penalty
+        if score < 0:
+            score = 0.0
         return round(score, 2)
     
+    @_memoize
     def _calculate_credit_utilization_score(self):
         """
         Calculate credit utilization score based on credit card usage
         """
-        credit_cards = CreditCard.objects.filter(customer=self.customer, is_active=True)
-        
-        if not credit_cards.exists():
+        cc_totals = self._get_cc_totals()
+
+        if cc_totals['cnt'] == 0:
             return 70.0  # Neutral-positive score if no credit cards
-        
-        total_limit = credit_cards.aggregate(
-            total=Sum('credit_limit'))['total'] or Decimal('0')
-        total_balance = credit_cards.aggregate(
-            total=Sum('current_balance'))['total'] or Decimal('0')
-        
+
+        # Cast once at the query boundary; plain float math from here on
+        total_limit = float(cc_totals['limit'] or 0)
+        total_balance = float(cc_totals['balance'] or 0)
+
         if total_limit == 0:
             return 70.0
-        
-        utilization_ratio = float(total_balance / total_limit)
-        
-        # Enhanced scoring with more granular levels
-        if utilization_ratio <= 0.05:
-            return 95.0  # Very low usage
-        elif utilization_ratio <= 0.10:
-            return 100.0  # Sweet spot
-        elif utilization_ratio <= 0.30:
-            return 85.0
-        elif utilization_ratio <= 0.50:
-            return 65.0
-        elif utilization_ratio <= 0.70:
-            return 45.0
-        elif utilization_ratio <= 0.90:
-            return 25.0
-        else:
-            return 10.0
+
+        utilization_ratio = total_balance / total_limit
+
+        # Band lookup over the utilization thresholds
+        return _UTIL_SCORES[bisect.bisect_left(_UTIL_THRESHOLDS, utilization_ratio)]
     
+    @_memoize
+    def _oldest_credit_date(self):
+        """
+        Get the oldest loan/card/account date using Min aggregates
+        """
+        oldest_dates = [
+            Loan.objects.filter(customer=self.customer).aggregate(
+                d=Min('loan_start_date'))['d'],
+            CreditCard.objects.filter(customer=self.customer).aggregate(
+                d=Min('card_issued_date'))['d'],
+            BankAccount.objects.filter(customer=self.customer).aggregate(
+                d=Min('account_opened_date'))['d'],
+        ]
+        oldest_dates = [d for d in oldest_dates if d is not None]
+        return min(oldest_dates) if oldest_dates else None
+
+    @_memoize
     def _calculate_credit_history_length_score(self):
         """
         Calculate credit history length score based on account age
         """
-        # Get oldest credit account
-        oldest_loan = Loan.objects.filter(customer=self.customer).order_by('loan_start_date').first()
-        oldest_card = CreditCard.objects.filter(customer=self.customer).order_by('card_issued_date').first()
-        oldest_account = BankAccount.objects.filter(customer=self.customer).order_by('account_opened_date').first()
-        
-        oldest_dates = []
-        if oldest_loan:
-            oldest_dates.append(oldest_loan.loan_start_date)
-        if oldest_card:
-            oldest_dates.append(oldest_card.card_issued_date)
-        if oldest_account:
-            oldest_dates.append(oldest_account.account_opened_date)
-        
-        if not oldest_dates:
+        oldest_date = self._oldest_credit_date()
+
+        if oldest_date is None:
             return 30.0  # Low score if no credit history
-        
-        oldest_date = min(oldest_dates)
-        years_of_history = (datetime.now().date() - oldest_date).days / 365.25
-        
-        # Score based on years of history
-        if years_of_history >= 10:
-            return 100.0
-        elif years_of_history >= 7:
-            return 85.0
-        elif years_of_history >= 5:
-            return 70.0
-        elif years_of_history >= 3:
-            return 55.0
-        elif years_of_history >= 1:
-            return 40.0
-        else:
-            return 25.0
+
+        years_of_history = (self._today - oldest_date).days / 365.25
+
+        # Band lookup over years of history
+        return _HISTORY_SCORES[bisect.bisect_right(_HISTORY_THRESHOLDS, years_of_history)]
     
+    @_memoize
     def _calculate_credit_mix_score(self):
         """
         Calculate credit mix score based on variety of credit types
         """
-        loan_types = set(Loan.objects.filter(
-            customer=self.customer, status='ACTIVE'
-        ).values_list('loan_type', flat=True))
-        
+        loan_types = self._get_active_loan_types()
+
         has_credit_cards = CreditCard.objects.filter(
             customer=self.customer, is_active=True
         ).exists()
@@ -258,36 +756,26 @@ class DynamicCibilScoreCalculator:
         
         return min(100.0, credit_mix_score)
     
+    @_memoize
     def _calculate_new_credit_score(self):
         """
         Calculate new credit score based on recent credit activity
         """
         # Recent accounts (last 6 months)
-        six_months_ago = timezone.now() - timedelta(days=180)
-        
         recent_loans = Loan.objects.filter(
             customer=self.customer,
-            created_at__gte=six_months_ago
+            created_at__gte=self._six_months_ago
         ).count()
-        
+
         recent_cards = CreditCard.objects.filter(
             customer=self.customer,
-            created_at__gte=six_months_ago
+            created_at__gte=self._six_months_ago
         ).count()
         
         total_recent_accounts = recent_loans + recent_cards
-        
-        # Score based on recent credit activity
-        if total_recent_accounts == 0:
-            return 100.0
-        elif total_recent_accounts == 1:
-            return 80.0
-        elif total_recent_accounts == 2:
-            return 60.0
-        elif total_recent_accounts <= 4:
-            return 40.0
-        else:
-            return 20.0
+
+        # Band lookup over recent account counts
+        return _NEW_CREDIT_SCORES[bisect.bisect_left(_NEW_CREDIT_THRESHOLDS, total_recent_accounts)]
 
     # DYNAMIC SCORING METHODS
 
@@ -299,8 +787,7 @@ class DynamicCibilScoreCalculator:
         credit_history_years = self._get_credit_age_years()
         total_credit_limit = self._get_total_credit_limit()
         account_diversity = self._get_account_diversity_score()
-        payment_consistency = self._get_payment_consistency_score()
-        
+
         # Base range adjustment factors
         range_multiplier = 1.0
         
@@ -343,24 +830,11 @@ class DynamicCibilScoreCalculator:
         """
         Convert 0-100 score to dynamic CIBIL scale using advanced algorithms
         """
-        # Normalize score to 0-1 range
-        normalized_score = max(0, min(100, score_0_100)) / 100.0
-        
-        # Apply sigmoid transformation for more realistic distribution
-        sigmoid_factor = 8  # Controls steepness of the curve
-        sigmoid_score = 1 / (1 + math.exp(-sigmoid_factor * (normalized_score - 0.5)))
-        
-        # Apply power transformation for fine-tuning
-        if normalized_score < 0.5:
-            power_score = math.pow(sigmoid_score, 1.2)  # Slightly compress lower scores
-        else:
-            power_score = math.pow(sigmoid_score, 0.9)   # Slightly expand higher scores
-        
-        # Map to dynamic range
-        score_range = dynamic_range['max_score'] - dynamic_range['min_score']
-        final_score = dynamic_range['min_score'] + (power_score * score_range)
-        
-        return max(dynamic_range['min_score'], min(dynamic_range['max_score'], int(final_score)))
+        return _convert_scale_kernel(
+            float(score_0_100),
+            dynamic_range['min_score'],
+            dynamic_range['max_score']
+        )
 
     # BEHAVIORAL ADJUSTMENT METHODS
 
@@ -369,7 +843,7 @@ class DynamicCibilScoreCalculator:
         Enhanced behavioral adjustments based on multiple factors
         """
         multiplier = 1.0
-        
+
         # Underutilization penalty
         utilization_multiplier = self._get_underutilization_penalty()
         multiplier *= utilization_multiplier
@@ -390,16 +864,16 @@ class DynamicCibilScoreCalculator:
     
     def _get_underutilization_penalty(self):
         """Apply penalty for severe underutilization of credit"""
-        credit_cards = CreditCard.objects.filter(customer=self.customer, is_active=True)
-        
-        if not credit_cards.exists():
+        cc_totals = self._get_cc_totals()
+
+        if cc_totals['cnt'] == 0:
             return 1.0
-        
-        total_limit = credit_cards.aggregate(total=Sum('credit_limit'))['total'] or Decimal('0')
-        total_balance = credit_cards.aggregate(total=Sum('current_balance'))['total'] or Decimal('0')
-        
+
+        total_limit = float(cc_totals['limit'] or 0)
+        total_balance = float(cc_totals['balance'] or 0)
+
         if total_limit > 0:
-            utilization = float(total_balance / total_limit)
+            utilization = total_balance / total_limit
             
             if utilization < 0.05 and total_limit > 100000:
                 return 0.85  # 15% penalty
@@ -449,12 +923,26 @@ class DynamicCibilScoreCalculator:
 
     # HELPER METHODS
 
+    @_memoize
+    def _get_active_loan_types(self):
+        """Get distinct active loan types, deduplicated by the database"""
+        return set(Loan.objects.filter(
+            customer=self.customer, status='ACTIVE'
+        ).values_list('loan_type', flat=True).distinct())
+
+    @_memoize
+    def _has_active_bank_accounts(self):
+        """Check whether the customer has any active bank accounts"""
+        return BankAccount.objects.filter(
+            customer=self.customer, is_active=True
+        ).exists()
+
+    @_memoize
     def _get_total_credit_limit(self):
         """Get total credit limit across all cards"""
-        return float(CreditCard.objects.filter(
-            customer=self.customer, is_active=True
-        ).aggregate(total=Sum('credit_limit'))['total'] or Decimal('0'))
+        return float(self._get_cc_totals()['limit'] or 0)
     
+    @_memoize
     def _get_account_diversity_score(self):
         """Calculate account diversity score"""
         score = 0
@@ -464,47 +952,44 @@ class DynamicCibilScoreCalculator:
             score += 25
         
         # Different loan types
-        loan_types = set(Loan.objects.filter(
-            customer=self.customer, status='ACTIVE'
-        ).values_list('loan_type', flat=True))
-        
+        loan_types = self._get_active_loan_types()
+
         score += len(loan_types) * 15  # 15 points per loan type
         
         # Bank accounts
-        if BankAccount.objects.filter(customer=self.customer, is_active=True).exists():
+        if self._has_active_bank_accounts():
             score += 20
         
         return min(100.0, score)
     
+    @_memoize
     def _get_payment_consistency_score(self):
         """Calculate payment consistency score"""
-        six_months_ago = timezone.now() - timedelta(days=180)
-        recent_payments = PaymentHistory.objects.filter(
+        stats = PaymentHistory.objects.filter(
             customer=self.customer,
-            payment_date__gte=six_months_ago
+            payment_date__gte=self._six_months_ago
+        ).aggregate(
+            total=Count('id'),
+            on_time=Count('id', filter=Q(payment_status='ON_TIME'))
         )
-        
-        if recent_payments.count() < 3:
+
+        if stats['total'] < 3:
             return 50.0
-        
-        on_time_payments = recent_payments.filter(payment_status='ON_TIME').count()
-        total_payments = recent_payments.count()
-        
-        consistency_ratio = on_time_payments / total_payments
+
+        consistency_ratio = stats['on_time'] / stats['total']
         return consistency_ratio * 100
     
+    @_memoize
     def _get_credit_growth_score(self):
         """Calculate credit growth score"""
-        one_year_ago = timezone.now() - timedelta(days=365)
-        
         current_limit = self._get_total_credit_limit()
-        old_cards = CreditCard.objects.filter(
+        old_limit = float(CreditCard.objects.filter(
             customer=self.customer,
-            created_at__lte=one_year_ago
-        ).aggregate(total=Sum('credit_limit'))['total'] or Decimal('0')
-        
-        if old_cards > 0:
-            growth_rate = (current_limit - float(old_cards)) / float(old_cards)
+            created_at__lte=self._one_year_ago
+        ).aggregate(total=Sum('credit_limit'))['total'] or 0)
+
+        if old_limit > 0:
+            growth_rate = (current_limit - old_limit) / old_limit
             # Optimal growth is 10-50% annually
             if 0.10 <= growth_rate <= 0.50:
                 return 85.0
@@ -515,58 +1000,44 @@ class DynamicCibilScoreCalculator:
         
         return 60.0  # Neutral for new customers
     
+    @_memoize
     def _get_credit_age_years(self):
         """Get credit history age in years"""
-        oldest_loan = Loan.objects.filter(customer=self.customer).order_by('loan_start_date').first()
-        oldest_card = CreditCard.objects.filter(customer=self.customer).order_by('card_issued_date').first()
-        oldest_account = BankAccount.objects.filter(customer=self.customer).order_by('account_opened_date').first()
-        
-        oldest_dates = []
-        if oldest_loan:
-            oldest_dates.append(oldest_loan.loan_start_date)
-        if oldest_card:
-            oldest_dates.append(oldest_card.card_issued_date)
-        if oldest_account:
-            oldest_dates.append(oldest_account.account_opened_date)
-        
-        if oldest_dates:
-            oldest_date = min(oldest_dates)
-            return (datetime.now().date() - oldest_date).days / 365.25
+        oldest_date = self._oldest_credit_date()
+        if oldest_date is not None:
+            return (self._today - oldest_date).days / 365.25
         return 0
     
     def _get_additional_metrics(self):
         """Get additional metrics for the CIBIL score record"""
-        # Count accounts
-        total_accounts = (
-            Loan.objects.filter(customer=self.customer).count() +
-            CreditCard.objects.filter(customer=self.customer).count() +
-            BankAccount.objects.filter(customer=self.customer).count()
+        # One combined aggregate per model instead of separate counts/sums
+        loan_stats = Loan.objects.filter(customer=self.customer).aggregate(
+            total=Count('id'),
+            active=Count('id', filter=Q(status='ACTIVE')),
+            outstanding=Sum('outstanding_amount', filter=Q(status='ACTIVE'))
         )
-        
-        active_accounts = (
-            Loan.objects.filter(customer=self.customer, status='ACTIVE').count() +
-            CreditCard.objects.filter(customer=self.customer, is_active=True).count() +
-            BankAccount.objects.filter(customer=self.customer, is_active=True).count()
+        card_stats = CreditCard.objects.filter(customer=self.customer).aggregate(
+            total=Count('id'),
+            active=Count('id', filter=Q(is_active=True))
         )
-        
-        # Credit limits and outstanding
-        credit_cards = CreditCard.objects.filter(customer=self.customer, is_active=True)
-        total_credit_limit = credit_cards.aggregate(
-            total=Sum('credit_limit'))['total'] or Decimal('0')
-        total_outstanding = (
-            credit_cards.aggregate(total=Sum('current_balance'))['total'] or Decimal('0')
-        ) + (
-            Loan.objects.filter(customer=self.customer, status='ACTIVE').aggregate(
-                total=Sum('outstanding_amount'))['total'] or Decimal('0')
+        account_stats = BankAccount.objects.filter(customer=self.customer).aggregate(
+            total=Count('id'),
+            active=Count('id', filter=Q(is_active=True))
         )
-        
-        # Utilization ratio
+
+        total_accounts = loan_stats['total'] + card_stats['total'] + account_stats['total']
+        active_accounts = loan_stats['active'] + card_stats['active'] + account_stats['active']
+
+        # Credit limits and outstanding
+        cc_totals = self._get_cc_totals()
+        total_credit_limit = cc_totals['limit'] or Decimal('0')
+        total_card_balance = cc_totals['balance'] or Decimal('0')
+        total_outstanding = total_card_balance + (loan_stats['outstanding'] or Decimal('0'))
+
+        # Utilization ratio (float math; the stored fields stay Decimal)
         utilization_ratio = 0
         if total_credit_limit > 0:
-            utilization_ratio = float(
-                (credit_cards.aggregate(total=Sum('current_balance'))['total'] or Decimal('0')) 
-                / total_credit_limit
-            )
+            utilization_ratio = float(total_card_balance) / float(total_credit_limit)
         
         return {
             'total_accounts': total_accounts,
@@ -580,30 +1051,17 @@ class DynamicCibilScoreCalculator:
 
     def get_comprehensive_score_breakdown(self):
         """Get comprehensive breakdown with all dynamic factors"""
-        # Calculate all individual scores
-        payment_history_score = self._calculate_payment_history_score()
-        credit_utilization_score = self._calculate_credit_utilization_score()
-        credit_history_length_score = self._calculate_credit_history_length_score()
-        credit_mix_score = self._calculate_credit_mix_score()
-        new_credit_score = self._calculate_new_credit_score()
-        
-        # Calculate contributions with custom weights
+        # Factor scores and contributions as parallel arrays (SoA)
+        factor_scores = self._get_factor_scores()
+        weighted_contributions = factor_scores * self.weights
+
         contributions = {}
-        factor_scores = {
-            'payment_history': payment_history_score,
-            'credit_utilization': credit_utilization_score,
-            'credit_history_length': credit_history_length_score,
-            'credit_mix': credit_mix_score,
-            'new_credit': new_credit_score
-        }
-        
-        for factor in self.score_factors:
-            raw_score = factor_scores[factor]
-            weighted_contribution = raw_score * self.score_factors[factor]
+        for i, factor in enumerate(self._FACTORS):
+            raw_score = float(factor_scores[i])
             contributions[factor] = {
-                'weight_percentage': round(self.score_factors[factor] * 100, 1),
+                'weight_percentage': round(self._w[i] * 100, 1),
                 'raw_score': round(raw_score, 2),
-                'weighted_contribution': round(weighted_contribution, 2),
+                'weighted_contribution': round(float(weighted_contributions[i]), 2),
                 'score_rating': self._get_score_rating(raw_score)
             }
         
@@ -651,15 +1109,4 @@ class DynamicCibilScoreCalculator:
     
     def _get_score_rating(self, score):
         """Get rating based on score"""
-        if score >= 90:
-            return "Excellent"
-        elif score >= 80:
-            return "Very Good"
-        elif score >= 70:
-            return "Good"
-        elif score >= 60:
-            return "Fair"
-        elif score >= 50:
-            return "Average"
-        else:
-            return "Poor"
\ No newline at end of file
+        return _RATINGS[min(int(score) // 10, 10)]
\ No newline at end of file
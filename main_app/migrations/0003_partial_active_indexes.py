@@ -0,0 +1,27 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main_app', '0002_uuid_primary_keys'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='bankaccount',
+            index=models.Index(
+                condition=models.Q(('is_active', True)),
+                fields=['customer'],
+                name='bank_cust_active_part',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='creditcard',
+            index=models.Index(
+                condition=models.Q(('is_active', True)),
+                fields=['customer'],
+                name='card_cust_active_part',
+            ),
+        ),
+    ]
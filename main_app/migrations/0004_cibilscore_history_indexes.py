@@ -0,0 +1,26 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main_app', '0003_partial_active_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='cibilscore',
+            index=models.Index(
+                fields=['customer', '-score_date'],
+                name='cibil_cust_date_desc',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='cibilscore',
+            index=models.Index(
+                condition=models.Q(('is_latest', True)),
+                fields=['customer'],
+                name='cibil_latest_partial',
+            ),
+        ),
+    ]
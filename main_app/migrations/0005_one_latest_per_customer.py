@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main_app', '0004_cibilscore_history_indexes'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='cibilscore',
+            constraint=models.UniqueConstraint(
+                condition=models.Q(('is_latest', True)),
+                fields=('customer',),
+                name='one_latest_per_customer',
+            ),
+        ),
+    ]
@@ -1,14 +1,35 @@
 # main_app/models.py
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Q
 from django.core.validators import MinValueValidator, MaxValueValidator
 from decimal import Decimal
+import bisect
+import os
 import uuid
 
+# Score category bands for CibilScore.get_score_category
+_SCORE_CATEGORY_CUTS = (600, 650, 700, 750)
+_SCORE_CATEGORIES = ('Very Poor', 'Poor', 'Fair', 'Good', 'Excellent')
+
 def generate_id():
-    return uuid.uuid4().hex  # This gives a 32-character hex string without hyphens
+    # Kept for historical migrations; new rows use UUIDField defaults.
+    # os.urandom skips the UUID object construction uuid4 pays for while
+    # producing the same 32-char random hex string.
+    return os.urandom(16).hex()
+
+class CustomerQuerySet(models.QuerySet):
+    def with_profile(self):
+        """
+        Prefetch everything the score calculator aggregates, so building
+        one customer's financial profile costs a fixed five queries
+        instead of one per related table per access.
+        """
+        return self.prefetch_related(
+            'credit_cards', 'loans', 'bank_accounts', 'payment_history')
+
 
 class Customer(models.Model):
-    id = models.CharField(primary_key=True, max_length=32, editable=False, default=generate_id)
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     pan_card_number = models.CharField(max_length=10, unique=True, db_index=True)
     full_name = models.CharField(max_length=255)
     date_of_birth = models.DateField()
@@ -17,7 +38,9 @@ class Customer(models.Model):
     address = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
-    
+
+    objects = CustomerQuerySet.as_manager()
+
     class Meta:
         db_table = 'customers'
         indexes = [
@@ -37,7 +60,7 @@ class BankAccount(models.Model):
         ('RECURRING_DEPOSIT', 'Recurring Deposit'),
     ]
     
-    id = models.CharField(primary_key=True, max_length=32, editable=False, default=generate_id)
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     customer = models.ForeignKey(Customer, on_delete=models.CASCADE, related_name='bank_accounts')
     bank_name = models.CharField(max_length=100)
     account_number = models.CharField(max_length=20)
@@ -53,6 +76,10 @@ class BankAccount(models.Model):
         unique_together = ['account_number', 'ifsc_code']
         indexes = [
             models.Index(fields=['customer', 'is_active']),
+            # Partial index over just the active rows (used on backends
+            # that support it; MySQL skips condition indexes)
+            models.Index(fields=['customer'], condition=Q(is_active=True),
+                         name='bank_cust_active_part'),
         ]
     
     def __str__(self):
@@ -66,7 +93,7 @@ class CreditCard(models.Model):
         ('AMEX', 'American Express'),
     ]
     
-    id = models.CharField(primary_key=True, max_length=32, editable=False, default=generate_id)
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     customer = models.ForeignKey(Customer, on_delete=models.CASCADE, related_name='credit_cards')
     bank_name = models.CharField(max_length=100)
     card_number_last_four = models.CharField(max_length=4)
@@ -83,6 +110,8 @@ class CreditCard(models.Model):
         db_table = 'credit_cards'
         indexes = [
             models.Index(fields=['customer', 'is_active']),
+            models.Index(fields=['customer'], condition=Q(is_active=True),
+                         name='card_cust_active_part'),
         ]
     
     def __str__(self):
@@ -105,7 +134,7 @@ class Loan(models.Model):
         ('DEFAULTED', 'Defaulted'),
     ]
     
-    id = models.CharField(primary_key=True, max_length=32, editable=False, default=generate_id)
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     customer = models.ForeignKey(Customer, on_delete=models.CASCADE, related_name='loans')
     bank_name = models.CharField(max_length=100)
     loan_account_number = models.CharField(max_length=50)
@@ -149,7 +178,7 @@ class PaymentHistory(models.Model):
         ('OTHER', 'Other'),
     ]
     
-    id = models.CharField(primary_key=True, max_length=32, editable=False, default=generate_id)
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     customer = models.ForeignKey(Customer, on_delete=models.CASCADE, related_name='payment_history')
     loan = models.ForeignKey(Loan, on_delete=models.CASCADE, null=True, blank=True)
     credit_card = models.ForeignKey(CreditCard, on_delete=models.CASCADE, null=True, blank=True)
@@ -174,7 +203,7 @@ class PaymentHistory(models.Model):
         return f"{self.customer.full_name} - {self.payment_type} - {self.due_date}"
 
 class CibilScore(models.Model):
-    id = models.CharField(primary_key=True, max_length=32, editable=False, default=generate_id)
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     customer = models.ForeignKey(Customer, on_delete=models.CASCADE, related_name='cibil_scores')
     score = models.IntegerField(
         validators=[MinValueValidator(300), MaxValueValidator(900)]
@@ -203,6 +232,22 @@ class CibilScore(models.Model):
         indexes = [
             models.Index(fields=['customer', 'is_latest']),
             models.Index(fields=['score_date']),
+            # Serves per-customer history reads ordered newest-first
+            # without a sort step
+            models.Index(fields=['customer', '-score_date'],
+                         name='cibil_cust_date_desc'),
+            # Tiny partial index over only the latest rows, for the
+            # demotion UPDATE in save()/bulk_create_latest (skipped on
+            # MySQL, which falls back to the composite index above)
+            models.Index(fields=['customer'], condition=Q(is_latest=True),
+                         name='cibil_latest_partial'),
+        ]
+        constraints = [
+            # At most one latest score per customer; enforced on backends
+            # with partial unique indexes (skipped on MySQL)
+            models.UniqueConstraint(
+                fields=['customer'], condition=Q(is_latest=True),
+                name='one_latest_per_customer'),
         ]
     
     def save(self, *args, **kwargs):
@@ -210,24 +255,35 @@ class CibilScore(models.Model):
             # Set all other scores for this customer to not latest
             CibilScore.objects.filter(customer=self.customer, is_latest=True).update(is_latest=False)
         super().save(*args, **kwargs)
+
+    @classmethod
+    def bulk_create_latest(cls, scores, batch_size=1000):
+        """
+        Persist many new latest scores in two queries instead of 2N.
+
+        save() issues one UPDATE (demoting the previous latest score)
+        plus one INSERT per row; for batch recalculations this demotes
+        every affected customer's previous scores with a single UPDATE
+        and inserts all rows with bulk_create. Callers using this path
+        must not call save() on the instances.
+        """
+        with transaction.atomic():
+            customer_ids = [score.customer_id for score in scores]
+            cls.objects.filter(
+                customer_id__in=customer_ids, is_latest=True
+            ).update(is_latest=False)
+            cls.objects.bulk_create(scores, batch_size=batch_size)
+
     
     def get_score_category(self):
-        if self.score >= 750:
-            return "Excellent"
-        elif self.score >= 700:
-            return "Good"
-        elif self.score >= 650:
-            return "Fair"
-        elif self.score >= 600:
-            return "Poor"
-        else:
-            return "Very Poor"
+        return _SCORE_CATEGORIES[
+            bisect.bisect_right(_SCORE_CATEGORY_CUTS, self.score)]
     
     def __str__(self):
         return f"{self.customer.full_name} - Score: {self.score} ({self.get_score_category()})"
 
 class CibilReport(models.Model):
-    id = models.CharField(primary_key=True, max_length=32, editable=False, default=generate_id)
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     customer = models.ForeignKey(Customer, on_delete=models.CASCADE, related_name='cibil_reports')
     cibil_score = models.ForeignKey(CibilScore, on_delete=models.CASCADE)
     
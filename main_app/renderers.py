@@ -0,0 +1,27 @@
+"""
+orjson-backed renderer for API responses.
+
+DRF's stock JSONRenderer encodes through the stdlib ``json`` module,
+which walks nested dicts in Python. The score endpoints return deep
+structures (factor breakdowns, history pages), so the encoder shows up
+in profiles; orjson does the same walk in C and serializes NumPy
+scalars from the batch paths without a pre-conversion pass.
+"""
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+_ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+class ORJSONRenderer(JSONRenderer):
+    """Drop-in JSONRenderer replacement that encodes with orjson"""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            # Browsable API asks for indented output; orjson only does
+            # 2-space indent, which is fine for a debug view
+            return orjson.dumps(data, default=str,
+                                option=_ORJSON_OPTIONS | orjson.OPT_INDENT_2)
+        return orjson.dumps(data, default=str, option=_ORJSON_OPTIONS)
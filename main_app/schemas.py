@@ -0,0 +1,74 @@
+"""
+Slotted result containers for the score calculators.
+
+These replace the nested dicts the calculators used to allocate per
+call: a frozen slots dataclass is a contiguous block of references,
+roughly a third the size of an equivalent dict and allocated on a fast
+path, which matters when scoring in bulk. to_dict() reproduces the
+exact response shape the JSON layer expects.
+"""
+from dataclasses import dataclass
+
+
+@dataclass(slots=True, frozen=True)
+class FactorScore:
+    raw_score: float
+    weight_percentage: float
+    weighted_contribution: float
+    rating: str
+
+    def to_dict(self):
+        return {
+            'raw_score': self.raw_score,
+            'weight_percentage': self.weight_percentage,
+            'weighted_contribution': self.weighted_contribution,
+            'rating': self.rating,
+        }
+
+
+@dataclass(slots=True, frozen=True)
+class ScoreRange:
+    min_score: int
+    max_score: int
+
+    def to_dict(self):
+        return {'min_score': self.min_score, 'max_score': self.max_score}
+
+
+@dataclass(slots=True, frozen=True)
+class FinancialMetrics:
+    credit_utilization_ratio: float
+    payment_success_rate: float
+    credit_types_count: int
+
+    def to_dict(self):
+        return {
+            'credit_utilization_ratio': self.credit_utilization_ratio,
+            'payment_success_rate': self.payment_success_rate,
+            'credit_types_count': self.credit_types_count,
+        }
+
+
+@dataclass(slots=True, frozen=True)
+class ScoreResult:
+    final_cibil_score: int
+    base_cibil_score: int
+    behavioral_multiplier: float
+    score_grade: str
+    score_range: ScoreRange
+    factor_scores: dict
+    financial_metrics: FinancialMetrics
+
+    def to_dict(self):
+        return {
+            'final_cibil_score': self.final_cibil_score,
+            'base_cibil_score': self.base_cibil_score,
+            'behavioral_multiplier': self.behavioral_multiplier,
+            'score_grade': self.score_grade,
+            'score_range': self.score_range.to_dict(),
+            'factor_scores': {
+                factor: score.to_dict()
+                for factor, score in self.factor_scores.items()
+            },
+            'financial_metrics': self.financial_metrics.to_dict(),
+        }
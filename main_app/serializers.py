@@ -20,6 +20,11 @@ class CreditCardSerializer(serializers.ModelSerializer):
         read_only_fields = ('id', 'created_at')
     
     def get_utilization_percentage(self, obj):
+        # Annotated by CreditCardViewSet; the Python division only runs
+        # for unannotated instances (nested card lists) or zero limits
+        utilization = getattr(obj, 'utilization', None)
+        if utilization is not None:
+            return round(utilization, 2)
         if obj.credit_limit > 0:
             return round((obj.current_balance / obj.credit_limit) * 100, 2)
         return 0
@@ -44,6 +49,18 @@ class CibilScoreSerializer(serializers.ModelSerializer):
         fields = '__all__'
         read_only_fields = ('id', 'score_date')
 
+class CibilScoreHistorySerializer(serializers.ModelSerializer):
+    """Lean row shape for score-history listings; pairs with .only()"""
+    score_category = serializers.CharField(source='get_score_category', read_only=True)
+
+    class Meta:
+        model = CibilScore
+        fields = (
+            'id', 'score', 'score_category', 'score_date', 'is_latest',
+            'payment_history_score', 'credit_utilization_score',
+        )
+
+
 class CibilReportSerializer(serializers.ModelSerializer):
     cibil_score_details = CibilScoreSerializer(source='cibil_score', read_only=True)
     
@@ -52,6 +69,15 @@ class CibilReportSerializer(serializers.ModelSerializer):
         fields = '__all__'
         read_only_fields = ('id', 'generated_at')
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """
+        Join the relations this serializer renders; list endpoints should
+        pass their queryset through here to avoid a per-report query for
+        the embedded score details.
+        """
+        return queryset.select_related('cibil_score', 'customer')
+
 class CustomerSerializer(serializers.ModelSerializer):
     bank_accounts = BankAccountSerializer(many=True, read_only=True)
     credit_cards = CreditCardSerializer(many=True, read_only=True)
@@ -64,21 +90,56 @@ class CustomerSerializer(serializers.ModelSerializer):
         read_only_fields = ('id', 'created_at', 'updated_at')
     
     def get_latest_cibil_score(self, obj):
-        latest_score = obj.cibil_scores.filter(is_latest=True).first()
-        if latest_score:
-            return CibilScoreSerializer(latest_score).data
-        return None
+        # Views prefetch the latest score into _latest_cibil_scores; only
+        # fall back to a query when serializing an unprefetched instance
+        prefetched = getattr(obj, '_latest_cibil_scores', None)
+        if prefetched is not None:
+            latest_score = prefetched[0] if prefetched else None
+        else:
+            latest_score = obj.cibil_scores.filter(is_latest=True).first()
+        if latest_score is None:
+            return None
+        # Reuse one serializer across rows: constructing a ModelSerializer
+        # deep-copies its whole field tree, which dominated list cost
+        serializer = getattr(self, '_cibil_score_serializer', None)
+        if serializer is None:
+            serializer = CibilScoreSerializer()
+            self._cibil_score_serializer = serializer
+        return serializer.to_representation(latest_score)
+
+class CustomerListSerializer(serializers.ModelSerializer):
+    """
+    Scalar customer fields plus annotated relation counts for list
+    views; the nested account/card/loan payloads stay on the detail
+    CustomerSerializer.
+    """
+    bank_account_count = serializers.IntegerField(read_only=True)
+    credit_card_count = serializers.IntegerField(read_only=True)
+    loan_count = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = Customer
+        fields = (
+            'id', 'pan_card_number', 'full_name', 'date_of_birth',
+            'phone_number', 'email', 'created_at', 'updated_at',
+            'bank_account_count', 'credit_card_count', 'loan_count',
+        )
+
 
 class CibilScoreRequestSerializer(serializers.Serializer):
     pan_card_number = serializers.CharField(max_length=10, min_length=10)
     
     def validate_pan_card_number(self, value):
-        # Basic PAN card validation
-        import re
-        pan_pattern = r'^[A-Z]{5}[0-9]{4}[A-Z]{1}$'
-        if not re.match(pan_pattern, value.upper()):
+        # Basic PAN card validation: AAAAA9999A, checked with slice
+        # predicates instead of a regex state machine
+        value = value.upper()
+        if not (len(value) == 10
+                and value.isascii()
+                and value[:5].isalpha()
+                and value[5:9].isdigit()
+                and value[9].isalpha()):
             raise serializers.ValidationError("Invalid PAN card format")
-        return value.upper()
+        return value
 
 class CibilScoreCalculationSerializer(serializers.Serializer):
     payment_history_weight = serializers.FloatField(default=0.35)
@@ -0,0 +1,113 @@
+"""
+Celery tasks for CIBIL score calculation.
+
+The dynamic score calculation walks every relation a customer has and
+writes a new score row; for heavy profiles that work no longer needs to
+hold a web worker. The task computes the same response body the
+synchronous endpoint returns and parks it in the shared cache, where
+the polling endpoint picks it up by task id.
+"""
+import bisect
+
+from celery import shared_task
+from django.core.cache import cache
+from django.db import transaction
+
+from .cibil_calculator import DynamicCibilScoreCalculator
+from .models import Customer
+
+# CIBIL letter grade bands, looked up by bisect instead of a branch ladder
+_GRADE_CUTS = (450, 500, 550, 600, 650, 700, 750, 800)
+_GRADES = ('F', 'D', 'D+', 'C', 'C+', 'B', 'B+', 'A', 'A+')
+
+# How long a finished task result stays pollable
+_TASK_RESULT_TTL = 300
+
+
+def get_cibil_grade(score):
+    """Convert CIBIL score to letter grade"""
+    return _GRADES[bisect.bisect_right(_GRADE_CUTS, score)]
+
+
+def build_dynamic_score_response(pan_card_number, custom_weights):
+    """
+    Run the dynamic calculation for a customer, persist the new score and
+    return the full response body. Shared by the synchronous endpoint and
+    the Celery task; raises Customer.DoesNotExist for unknown PANs.
+    """
+    customer = Customer.objects.get(pan_card_number=pan_card_number)
+
+    # Create calculator with custom weights
+    calculator = DynamicCibilScoreCalculator(customer, custom_weights)
+
+    # Calculate dynamic CIBIL score
+    new_score, calculation_details = calculator.calculate_dynamic_cibil_score(commit=False)
+    new_score.customer = customer
+    new_score.is_latest = True
+
+    with transaction.atomic():
+        # save() demotes the previous latest row itself (one indexed
+        # UPDATE), so no separate update is needed here
+        new_score.save()
+
+    # Get comprehensive breakdown
+    comprehensive_breakdown = calculator.get_comprehensive_score_breakdown()
+
+    return {
+        'pan_card_number': pan_card_number,
+        'customer': {
+            'full_name': customer.full_name,
+            'email': customer.email,
+            'phone': customer.phone_number,
+            'pan_card_number': customer.pan_card_number
+        },
+        'cibil_score_summary': {
+            'final_score': comprehensive_breakdown['final_cibil_score'],
+            'base_score': comprehensive_breakdown['base_cibil_score'],
+            'score_range': {
+                'minimum_possible': comprehensive_breakdown['dynamic_range']['min_score'],
+                'maximum_possible': comprehensive_breakdown['dynamic_range']['max_score'],
+                'range_width': comprehensive_breakdown['dynamic_range']['range_width']
+            },
+            'score_grade': get_cibil_grade(comprehensive_breakdown['final_cibil_score']),
+            'improvement_potential': comprehensive_breakdown['summary']['improvement_potential']
+        },
+        'weight_configuration': {
+            'custom_weights_applied': bool(custom_weights),
+            'weights_used': comprehensive_breakdown['custom_weights'],
+            'weights_normalized': True
+        },
+        'detailed_breakdown': comprehensive_breakdown,
+        'calculation_metadata': {
+            'calculation_date': new_score.score_date.isoformat(),
+            'dynamic_range_applied': True,
+            'behavioral_adjustments_applied': True,
+            'algorithm_version': '2.0_dynamic'
+        }
+    }
+
+
+@shared_task(bind=True)
+def process_cibil_score_task(self, pan_card_number, custom_weights=None):
+    """
+    Run the dynamic calculation off the request thread and cache the
+    outcome under the task id for the polling endpoint.
+    """
+    task_key = f"cibil:task:{self.request.id}"
+    try:
+        response_data = build_dynamic_score_response(
+            pan_card_number, custom_weights or {})
+        cache.set(task_key,
+                  {'status': 'complete', 'result': response_data},
+                  _TASK_RESULT_TTL)
+    except Customer.DoesNotExist:
+        cache.set(task_key,
+                  {'status': 'failed',
+                   'error': 'Customer not found with the provided PAN card number'},
+                  _TASK_RESULT_TTL)
+    except Exception as e:
+        cache.set(task_key,
+                  {'status': 'failed',
+                   'error': 'Failed to calculate dynamic CIBIL score',
+                   'details': str(e)},
+                  _TASK_RESULT_TTL)
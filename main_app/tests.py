@@ -1,3 +1,45 @@
-from django.test import TestCase
+from django.test import SimpleTestCase
 
-# Create your tests here.
+from .user_input_calculator import UserInputCibilCalculator
+
+
+class OnTimeRatioBoundaryTests(SimpleTestCase):
+    """
+    Batch and scalar paths must agree exactly at the 95% on-time
+    boundary, where float32 input columns previously rounded 38/40 just
+    below 0.95 and silently dropped the 1.04 consistency boost.
+    """
+
+    profile = {
+        'total_payments': 40,
+        'on_time_payments': 38,  # exactly 0.95 on-time
+        'late_payments': 2,
+        'missed_payments': 0,
+        'total_credit_limit': 200000,
+        'current_balance': 40000,
+        'credit_history_years': 6,
+        'has_credit_card': True,
+        'has_bank_account': True,
+        'has_home_loan': False,
+        'has_car_loan': False,
+        'has_personal_loan': True,
+        'recent_inquiries': 1,
+    }
+
+    def test_scalar_applies_consistency_boost_at_boundary(self):
+        result = UserInputCibilCalculator(self.profile).calculate_cibil_score()
+        # utilization 0.20 -> 1.03, on-time ratio 0.95 -> 1.04
+        self.assertAlmostEqual(result.behavioral_multiplier, 1.0712, places=4)
+
+    def test_batch_matches_scalar_at_boundary(self):
+        scalar = UserInputCibilCalculator(self.profile).calculate_cibil_score()
+        batch = UserInputCibilCalculator.calculate_batch(
+            {field: [value] for field, value in self.profile.items()})
+
+        self.assertEqual(
+            int(batch['final_cibil_score'][0]), scalar.final_cibil_score)
+        self.assertEqual(
+            int(batch['base_cibil_score'][0]), scalar.base_cibil_score)
+        self.assertAlmostEqual(
+            float(batch['behavioral_multiplier'][0]),
+            scalar.behavioral_multiplier, places=4)
@@ -13,6 +13,8 @@ urlpatterns = [
     #path('check-dynamic-cibil-score/', views.check_dynamic_cibil_score, name='check_dynamic_cibil_score'),
     path('check-cibil-score/', views.CheckCibilScoreView.as_view(), name='check-cibil-score'),
     path('check-dynamic-cibil-score/', views.CheckDynamicCibilScoreView.as_view(), name='check-dynamic-cibil-score'),
+    path('check-dynamic-cibil-score/async/', views.CheckDynamicCibilScoreAsyncView.as_view(), name='check-dynamic-cibil-score-async'),
+    path('cibil-score-tasks/<str:task_id>/', views.get_cibil_score_task_status, name='cibil_score_task_status'),
     
     # Customer management
     path('customers/', views.CustomerViewSet.as_view(), name='customer_list_create'),
@@ -0,0 +1,682 @@
+from django.core.exceptions import ValidationError
+
+from .schemas import FactorScore, FinancialMetrics, ScoreRange, ScoreResult
+
+import bisect
+import functools
+import math
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is an optional accelerator
+    njit = None
+    prange = range
+
+# Power-curve lookup tables: the sigmoid output is always in (0, 1), so
+# s ** 1.1 and s ** 0.95 are read from 1025-entry tables at a
+# round-to-nearest index instead of calling libm pow (two transcendental
+# evaluations per call). Max error is well under one CIBIL point on the
+# final integer score.
+_POW_LUT_11 = np.power(np.linspace(0.0, 1.0, 1025), 1.1)
+_POW_LUT_095 = np.power(np.linspace(0.0, 1.0, 1025), 0.95)
+
+
+def _to_cibil_scale(normalized_score, min_score, max_score):
+    """Scalar sigmoid conversion of a 0-100 score to the CIBIL scale"""
+    normalized = max(0.0, min(100.0, normalized_score)) / 100.0
+    sigmoid_score = 1.0 / (1.0 + math.exp(-6.0 * (normalized - 0.5)))
+
+    index = int(sigmoid_score * 1024.0 + 0.5)
+    if normalized < 0.5:
+        curved_score = _POW_LUT_11[index]
+    else:
+        curved_score = _POW_LUT_095[index]
+
+    final_score = min_score + curved_score * (max_score - min_score)
+    return max(min_score, min(max_score, int(final_score)))
+
+
+def _compute_full_score(tp, ot, late, missed, lim, bal, years,
+                        has_cc, has_bank, has_home, has_car, has_pers,
+                        recent, w_ph, w_cu, w_chl, w_cm, w_nc,
+                        base_min, base_max):
+    """
+    Fused scoring kernel: all five factor ladders, the behavioral
+    multiplier, the dynamic range and both scale conversions in one
+    function, so the whole pipeline compiles to a single branchy
+    straight-line kernel with no intermediate Python objects.
+
+    Returns (final_cibil, base_cibil, multiplier, payment_score,
+    utilization_score, history_score, mix_score, new_credit_score,
+    min_score, max_score).
+    """
+    # Payment history
+    if tp == 0:
+        payment_score = 50.0
+    else:
+        penalty = missed * 5.0 + late * 2.0
+        if penalty > 30.0:
+            penalty = 30.0
+        payment_score = (ot / tp) * 100.0 - penalty
+        if payment_score < 0.0:
+            payment_score = 0.0
+
+    # Credit utilization
+    if lim == 0:
+        utilization_score = 50.0
+        util_ratio = 0.0
+    else:
+        util_ratio = bal / (lim if lim > 1 else 1)
+        if util_ratio <= 0.01:
+            utilization_score = 90.0
+        elif util_ratio <= 0.10:
+            utilization_score = 100.0
+        elif util_ratio <= 0.30:
+            utilization_score = 85.0
+        elif util_ratio <= 0.50:
+            utilization_score = 65.0
+        elif util_ratio <= 0.70:
+            utilization_score = 40.0
+        elif util_ratio <= 0.90:
+            utilization_score = 20.0
+        else:
+            utilization_score = 5.0
+
+    # Credit history length
+    if years <= 0.5:
+        history_score = 5.0
+    elif years <= 1:
+        history_score = 20.0
+    elif years <= 3:
+        history_score = 35.0
+    elif years <= 5:
+        history_score = 50.0
+    elif years <= 7:
+        history_score = 65.0
+    elif years <= 10:
+        history_score = 80.0
+    elif years <= 15:
+        history_score = 90.0
+    else:
+        history_score = 100.0
+
+    # Credit mix
+    mix_score = (
+        25.0 * has_cc + 20.0 * has_bank + 30.0 * has_home
+        + 15.0 * has_car + 10.0 * has_pers
+    )
+    if mix_score > 100.0:
+        mix_score = 100.0
+
+    # New credit
+    if recent <= 0:
+        new_credit_score = 100.0
+    elif recent == 1:
+        new_credit_score = 80.0
+    elif recent == 2:
+        new_credit_score = 60.0
+    elif recent <= 4:
+        new_credit_score = 35.0
+    else:
+        new_credit_score = 10.0
+
+    base_score = (
+        payment_score * w_ph
+        + utilization_score * w_cu
+        + history_score * w_chl
+        + mix_score * w_cm
+        + new_credit_score * w_nc
+    )
+
+    # Behavioral multiplier
+    multiplier = 1.0
+    if 0.01 < util_ratio <= 0.30:
+        multiplier *= 1.03
+    elif util_ratio > 0.90:
+        multiplier *= 0.93
+    if tp >= 6:
+        on_time_ratio = ot / tp
+        if on_time_ratio >= 0.95:
+            multiplier *= 1.04
+        elif on_time_ratio < 0.60:
+            multiplier *= 0.95
+    credit_types = has_cc + has_bank + has_home + has_car + has_pers
+    if credit_types >= 4:
+        multiplier *= 1.03
+    elif credit_types == 0:
+        multiplier *= 0.96
+    if recent > 4:
+        multiplier *= 0.95
+    multiplier = round(multiplier, 4)
+
+    # Dynamic range
+    max_score = base_max
+    if years < 1:
+        max_score -= 100
+    if lim == 0:
+        max_score -= 50
+
+    base_cibil = _to_cibil_scale(base_score, base_min, max_score)
+    final_cibil = _to_cibil_scale(base_score * multiplier, base_min, max_score)
+
+    return (final_cibil, base_cibil, multiplier, payment_score,
+            utilization_score, history_score, mix_score, new_credit_score,
+            base_min, max_score)
+
+
+def _score_batch(tp, ot, late, missed, lim, bal, years,
+                 has_cc, has_bank, has_home, has_car, has_pers, recent,
+                 w_ph, w_cu, w_chl, w_cm, w_nc, base_min, base_max,
+                 final_out, base_out, mult_out):
+    """
+    Parallel batch driver: one fused-kernel call per profile across all
+    cores via prange, writing into preallocated output arrays. The loop
+    body touches only scalars and array elements so numba parallelizes
+    it in nopython mode.
+    """
+    for i in prange(tp.shape[0]):
+        result = _compute_full_score(
+            tp[i], ot[i], late[i], missed[i], lim[i], bal[i], years[i],
+            has_cc[i], has_bank[i], has_home[i], has_car[i], has_pers[i],
+            recent[i], w_ph, w_cu, w_chl, w_cm, w_nc, base_min, base_max
+        )
+        final_out[i] = result[0]
+        base_out[i] = result[1]
+        mult_out[i] = result[2]
+
+
+if njit is not None:
+    _to_cibil_scale = njit(cache=True, fastmath=True)(_to_cibil_scale)
+    _compute_full_score = njit(cache=True, fastmath=True)(_compute_full_score)
+    _score_batch = njit(
+        parallel=True, cache=True, fastmath=True)(_score_batch)
+
+
+# Factor score thresholds shared by the scalar and batch paths
+
+_UTILIZATION_THRESHOLDS = (0.01, 0.10, 0.30, 0.50, 0.70, 0.90)
+_UTILIZATION_SCORES = (90.0, 100.0, 85.0, 65.0, 40.0, 20.0, 5.0)
+
+_HISTORY_THRESHOLDS = (0.5, 1, 3, 5, 7, 10, 15)
+_HISTORY_SCORES = (5.0, 20.0, 35.0, 50.0, 65.0, 80.0, 90.0, 100.0)
+
+_NEW_CREDIT_THRESHOLDS = (0, 1, 2, 4)
+_NEW_CREDIT_SCORES = (100.0, 80.0, 60.0, 35.0, 10.0)
+
+_RATING_THRESHOLDS = (50, 60, 70, 80, 90)
+_RATING_LABELS = ('Poor', 'Average', 'Fair', 'Good', 'Very Good', 'Excellent')
+
+_DEFAULT_SCORE_FACTORS = {
+    'payment_history': 0.35,
+    'credit_utilization': 0.30,
+    'credit_history_length': 0.15,
+    'credit_mix': 0.10,
+    'new_credit': 0.10,
+}
+_DEFAULT_WEIGHTS = tuple(_DEFAULT_SCORE_FACTORS.values())
+
+
+@functools.lru_cache(maxsize=32)
+def _normalize_weights_cached(items):
+    """
+    Normalize a frozenset of (factor, weight) items to a tuple of five
+    weights in factor order, summing to 1.0. Cached because batch jobs
+    reuse the same weight set across every profile.
+    """
+    custom = dict(items)
+    weights = {
+        key: custom.get(key, default)
+        for key, default in _DEFAULT_SCORE_FACTORS.items()
+    }
+    total = sum(weights.values())
+    if total <= 0:
+        return _DEFAULT_WEIGHTS
+    return tuple(weights[key] / total for key in _DEFAULT_SCORE_FACTORS)
+
+
+# Shared immutable result for profiles with no credit data at all,
+# assigned after the class definition below
+_EMPTY_PROFILE_RESULT = None
+
+_GRADE_THRESHOLDS = (600, 650, 700, 750, 800)
+_GRADE_LABELS = (
+    'Poor', 'Below Average', 'Fair', 'Good', 'Very Good', 'Excellent')
+
+# Array forms of the label tables for the batch path: one searchsorted
+# call labels a whole batch at once
+_RATING_BREAKS = np.asarray(_RATING_THRESHOLDS)
+_RATING_LABEL_ARR = np.asarray(_RATING_LABELS)
+_GRADE_BREAKS = np.asarray(_GRADE_THRESHOLDS)
+_GRADE_LABEL_ARR = np.asarray(_GRADE_LABELS)
+
+
+def _grade_batch(cibil_scores):
+    """Vectorized counterpart of _get_score_grade"""
+    return _GRADE_LABEL_ARR[
+        np.searchsorted(_GRADE_BREAKS, cibil_scores, side='right')]
+
+
+def _rating_batch(scores):
+    """Vectorized counterpart of _get_score_rating"""
+    return _RATING_LABEL_ARR[
+        np.searchsorted(_RATING_BREAKS, scores, side='right')]
+
+# Credit mix score for every combination of the five product flags,
+# indexed by the packed bitmask (cc | bank<<1 | home<<2 | car<<3 | pers<<4)
+_MIX_SCORE = tuple(
+    min(100,
+        25 * (mask & 1)
+        + 20 * ((mask >> 1) & 1)
+        + 30 * ((mask >> 2) & 1)
+        + 15 * ((mask >> 3) & 1)
+        + 10 * ((mask >> 4) & 1))
+    for mask in range(32)
+)
+
+
+class UserInputCibilCalculator:
+    """
+    CIBIL score calculator driven by caller-supplied financial data.
+
+    Unlike DynamicCibilScoreCalculator, which derives every factor from a
+    customer's stored records, this calculator scores a financial profile
+    handed in as a plain dict — the input path for what-if and
+    self-assessment style requests where nothing is persisted.
+
+    calculate_batch() scores many profiles at once from NumPy
+    structure-of-arrays columns, replacing per-row Python arithmetic with
+    a handful of vectorized operations over contiguous arrays.
+    """
+
+    _FACTORS = (
+        'payment_history',
+        'credit_utilization',
+        'credit_history_length',
+        'credit_mix',
+        'new_credit',
+    )
+
+    _REQUIRED_FIELDS = (
+        'total_payments',
+        'on_time_payments',
+        'late_payments',
+        'missed_payments',
+        'total_credit_limit',
+        'current_balance',
+        'credit_history_years',
+        'has_credit_card',
+        'has_bank_account',
+        'has_home_loan',
+        'has_car_loan',
+        'has_personal_loan',
+        'recent_inquiries',
+    )
+
+    def __init__(self, financial_data, custom_weights=None):
+        self.default_score_factors = _DEFAULT_SCORE_FACTORS.copy()
+
+        self._validate_financial_data(financial_data)
+        self.financial_data = financial_data
+
+        # Hoist the profile fields out of the dict once; the scoring
+        # methods read these attributes instead of probing the dict
+        self._tp = financial_data['total_payments']
+        self._ot = financial_data['on_time_payments']
+        self._late = financial_data['late_payments']
+        self._missed = financial_data['missed_payments']
+        self._lim = financial_data['total_credit_limit']
+        self._bal = financial_data['current_balance']
+        self._years = financial_data['credit_history_years']
+        self._has_cc = bool(financial_data['has_credit_card'])
+        self._has_bank = bool(financial_data['has_bank_account'])
+        self._has_home = bool(financial_data['has_home_loan'])
+        self._has_car = bool(financial_data['has_car_loan'])
+        self._has_pers = bool(financial_data['has_personal_loan'])
+        self._recent = financial_data['recent_inquiries']
+        self._mix_mask = (
+            self._has_cc
+            | self._has_bank << 1
+            | self._has_home << 2
+            | self._has_car << 3
+            | self._has_pers << 4
+        )
+        self._credit_types = self._mix_mask.bit_count()
+        # Shared ratios, computed once; the factor scores, behavioral
+        # adjustments and financial_metrics all read these
+        self._util_ratio = self._bal / max(self._lim, 1) if self._lim else 0.0
+        self._otp_ratio = self._ot / self._tp if self._tp else 0.0
+
+        if custom_weights:
+            self._w = _normalize_weights_cached(frozenset(custom_weights.items()))
+        else:
+            self._w = _DEFAULT_WEIGHTS
+        self.score_factors = dict(zip(self._FACTORS, self._w))
+
+        self.base_min_score = 300
+        self.base_max_score = 900
+
+    def _validate_financial_data(self, financial_data):
+        """Validate that all required profile fields are present"""
+        missing = [
+            field for field in self._REQUIRED_FIELDS
+            if field not in financial_data
+        ]
+        if missing:
+            raise ValidationError(
+                f"Missing financial data fields: {', '.join(missing)}"
+            )
+
+    # FACTOR CALCULATION METHODS
+
+    def calculate_payment_history_score(self):
+        """Calculate payment history score from supplied payment counts"""
+        if self._tp == 0:
+            return 50.0
+
+        penalty = min(30.0, self._missed * 5.0 + self._late * 2.0)
+        return max(0.0, self._otp_ratio * 100 - penalty)
+
+    def calculate_credit_utilization_score(self):
+        """Calculate credit utilization score from limit and balance"""
+        if self._lim == 0:
+            return 50.0
+
+        return _UTILIZATION_SCORES[
+            bisect.bisect_left(_UTILIZATION_THRESHOLDS, self._util_ratio)]
+
+    def calculate_credit_history_length_score(self):
+        """Calculate credit history length score from years of history"""
+        return _HISTORY_SCORES[
+            bisect.bisect_left(_HISTORY_THRESHOLDS, self._years)]
+
+    def calculate_credit_mix_score(self):
+        """Calculate credit mix score from the product flags"""
+        return float(_MIX_SCORE[self._mix_mask])
+
+    def calculate_new_credit_score(self):
+        """Calculate new credit score from recent inquiries"""
+        return _NEW_CREDIT_SCORES[
+            bisect.bisect_left(_NEW_CREDIT_THRESHOLDS, self._recent)]
+
+    # ADJUSTMENT AND RANGE METHODS
+
+    def calculate_behavioral_adjustments(self):
+        """Calculate the behavioral multiplier for the supplied profile"""
+        multiplier = 1.0
+
+        if 0.01 < self._util_ratio <= 0.30:
+            multiplier *= 1.03
+        elif self._util_ratio > 0.90:
+            multiplier *= 0.93
+
+        if self._tp >= 6:
+            if self._otp_ratio >= 0.95:
+                multiplier *= 1.04
+            elif self._otp_ratio < 0.60:
+                multiplier *= 0.95
+
+        if self._credit_types >= 4:
+            multiplier *= 1.03
+        elif self._credit_types == 0:
+            multiplier *= 0.96
+
+        if self._recent > 4:
+            multiplier *= 0.95
+
+        return round(multiplier, 4)
+
+    def calculate_dynamic_score_range(self):
+        """Calculate the score range for the supplied profile"""
+        max_score = self.base_max_score
+        if self._years < 1:
+            max_score -= 100
+        if self._lim == 0:
+            max_score -= 50
+
+        return {'min_score': self.base_min_score, 'max_score': max_score}
+
+    def convert_to_cibil_scale(self, normalized_score, score_range):
+        """Convert a 0-100 score to the CIBIL scale with a sigmoid curve"""
+        return _to_cibil_scale(
+            float(normalized_score),
+            score_range['min_score'],
+            score_range['max_score']
+        )
+
+    # MAIN CALCULATION METHOD
+
+    def calculate_cibil_score(self):
+        """Calculate the CIBIL score for the supplied financial profile"""
+        # Empty profiles all produce the same result; return the shared
+        # precomputed one instead of running the kernel
+        if (_EMPTY_PROFILE_RESULT is not None
+                and self._w is _DEFAULT_WEIGHTS
+                and self._tp == 0 and self._lim == 0 and self._years == 0
+                and self._recent == 0 and self._mix_mask == 0):
+            return _EMPTY_PROFILE_RESULT
+
+        w = self._w
+        (final_cibil_score, base_cibil_score, behavioral_multiplier,
+         payment_score, utilization_score, history_score, mix_score,
+         new_credit_score, min_score, max_score) = _compute_full_score(
+            float(self._tp), float(self._ot), float(self._late),
+            float(self._missed), float(self._lim), float(self._bal),
+            float(self._years), int(self._has_cc), int(self._has_bank),
+            int(self._has_home), int(self._has_car), int(self._has_pers),
+            int(self._recent),
+            w[0], w[1], w[2], w[3], w[4],
+            self.base_min_score, self.base_max_score
+        )
+
+        raw_scores = (payment_score, utilization_score, history_score,
+                      mix_score, new_credit_score)
+
+        factor_scores = {}
+        for factor, raw_score, weight in zip(self._FACTORS, raw_scores, w):
+            factor_scores[factor] = FactorScore(
+                raw_score=round(raw_score, 2),
+                weight_percentage=round(weight * 100, 1),
+                weighted_contribution=round(raw_score * weight, 2),
+                rating=self._get_score_rating(raw_score),
+            )
+
+        return ScoreResult(
+            final_cibil_score=final_cibil_score,
+            base_cibil_score=base_cibil_score,
+            behavioral_multiplier=behavioral_multiplier,
+            score_grade=self._get_score_grade(final_cibil_score),
+            score_range=ScoreRange(min_score=min_score, max_score=max_score),
+            factor_scores=factor_scores,
+            financial_metrics=FinancialMetrics(
+                credit_utilization_ratio=round(self._util_ratio * 100, 2),
+                payment_success_rate=round(self._otp_ratio * 100, 2),
+                credit_types_count=self._credit_types,
+            ),
+        )
+
+    # BATCH CALCULATION
+
+    @classmethod
+    def calculate_batch(cls, columns, custom_weights=None):
+        """
+        Score many profiles at once from structure-of-arrays columns.
+
+        ``columns`` maps the same field names as ``financial_data`` to
+        equal-length NumPy arrays (or sequences). All five factor scores,
+        the behavioral multiplier, the score range and the scale
+        conversion are computed with vectorized operations in one pass,
+        so per-profile work is a few C-level ufunc calls instead of a
+        Python branch ladder. Returns a dict of result arrays.
+        """
+        config = cls(
+            {field: 0 for field in cls._REQUIRED_FIELDS},
+            custom_weights
+        )
+
+        total_payments = np.atleast_1d(
+            np.asarray(columns['total_payments'], dtype=np.float64))
+        on_time = np.atleast_1d(
+            np.asarray(columns['on_time_payments'], dtype=np.float64))
+        late = np.atleast_1d(
+            np.asarray(columns['late_payments'], dtype=np.float64))
+        missed = np.atleast_1d(
+            np.asarray(columns['missed_payments'], dtype=np.float64))
+        total_limit = np.atleast_1d(
+            np.asarray(columns['total_credit_limit'], dtype=np.float64))
+        balance = np.atleast_1d(
+            np.asarray(columns['current_balance'], dtype=np.float64))
+        years = np.atleast_1d(
+            np.asarray(columns['credit_history_years'], dtype=np.float64))
+        has_cc = np.atleast_1d(
+            np.asarray(columns['has_credit_card'], dtype=np.int8))
+        has_bank = np.atleast_1d(
+            np.asarray(columns['has_bank_account'], dtype=np.int8))
+        has_home = np.atleast_1d(
+            np.asarray(columns['has_home_loan'], dtype=np.int8))
+        has_car = np.atleast_1d(
+            np.asarray(columns['has_car_loan'], dtype=np.int8))
+        has_personal = np.atleast_1d(
+            np.asarray(columns['has_personal_loan'], dtype=np.int8))
+        inquiries = np.atleast_1d(
+            np.asarray(columns['recent_inquiries'], dtype=np.float64))
+
+        # Payment history
+        on_time_ratio = on_time / np.maximum(total_payments, 1)
+        penalty = np.minimum(30.0, missed * 5.0 + late * 2.0)
+        payment_scores = np.where(
+            total_payments == 0,
+            50.0,
+            np.maximum(0.0, on_time_ratio * 100 - penalty)
+        )
+
+        # Credit utilization
+        util_ratio = np.where(
+            total_limit == 0, 0.0, balance / np.maximum(total_limit, 1))
+        utilization_scores = np.where(
+            total_limit == 0,
+            50.0,
+            np.select(
+                [util_ratio <= t for t in _UTILIZATION_THRESHOLDS],
+                _UTILIZATION_SCORES[:-1],
+                default=_UTILIZATION_SCORES[-1]
+            )
+        )
+
+        # Credit history length
+        history_scores = np.asarray(_HISTORY_SCORES)[
+            np.searchsorted(_HISTORY_THRESHOLDS, years, side='left')
+        ]
+
+        # Credit mix
+        mix_scores = np.minimum(
+            100.0,
+            25.0 * has_cc + 20.0 * has_bank + 30.0 * has_home
+            + 15.0 * has_car + 10.0 * has_personal
+        )
+
+        # New credit
+        new_credit_scores = np.asarray(_NEW_CREDIT_SCORES)[
+            np.searchsorted(_NEW_CREDIT_THRESHOLDS, inquiries, side='left')
+        ]
+
+        weights = config._w
+        if njit is not None:
+            # Parallel fused-kernel path: one native call per profile,
+            # spread across cores by prange
+            n = total_payments.shape[0]
+            final_out = np.empty(n, dtype=np.int32)
+            base_out = np.empty(n, dtype=np.int32)
+            mult_out = np.empty(n, dtype=np.float32)
+            _score_batch(
+                total_payments, on_time, late, missed, total_limit,
+                balance, years,
+                has_cc.astype(np.int64), has_bank.astype(np.int64),
+                has_home.astype(np.int64), has_car.astype(np.int64),
+                has_personal.astype(np.int64),
+                inquiries.astype(np.int64),
+                weights[0], weights[1], weights[2], weights[3], weights[4],
+                config.base_min_score, config.base_max_score,
+                final_out, base_out, mult_out
+            )
+            return {
+                'final_cibil_score': final_out,
+                'base_cibil_score': base_out,
+                'behavioral_multiplier': mult_out,
+                'score_grade': _grade_batch(final_out),
+            }
+
+        base_scores = (
+            payment_scores * weights[0]
+            + utilization_scores * weights[1]
+            + history_scores * weights[2]
+            + mix_scores * weights[3]
+            + new_credit_scores * weights[4]
+        )
+
+        # Behavioral multiplier
+        credit_types = has_cc + has_bank + has_home + has_car + has_personal
+        multipliers = np.ones_like(base_scores)
+        multipliers *= np.where(
+            (util_ratio > 0.01) & (util_ratio <= 0.30), 1.03,
+            np.where(util_ratio > 0.90, 0.93, 1.0))
+        multipliers *= np.where(
+            (total_payments >= 6) & (on_time_ratio >= 0.95), 1.04,
+            np.where((total_payments >= 6) & (on_time_ratio < 0.60), 0.95, 1.0))
+        multipliers *= np.where(
+            credit_types >= 4, 1.03, np.where(credit_types == 0, 0.96, 1.0))
+        multipliers *= np.where(inquiries > 4, 0.95, 1.0)
+        multipliers = np.round(multipliers, 4)
+
+        # Dynamic range
+        max_scores = (
+            float(config.base_max_score)
+            - 100.0 * (years < 1)
+            - 50.0 * (total_limit == 0)
+        )
+        min_scores = np.full_like(max_scores, float(config.base_min_score))
+
+        base_cibil = cls._convert_batch(base_scores, min_scores, max_scores)
+        final_cibil = cls._convert_batch(
+            base_scores * multipliers, min_scores, max_scores)
+
+        return {
+            'final_cibil_score': final_cibil,
+            'base_cibil_score': base_cibil,
+            'behavioral_multiplier': multipliers,
+            'score_grade': _grade_batch(final_cibil),
+        }
+
+    @staticmethod
+    def _convert_batch(scores, min_scores, max_scores):
+        """Vectorized counterpart of convert_to_cibil_scale"""
+        normalized = np.clip(scores, 0.0, 100.0) / 100.0
+        sigmoid = 1.0 / (1.0 + np.exp(-6.0 * (normalized - 0.5)))
+        indexes = (sigmoid * 1024.0 + 0.5).astype(np.intp)
+        curved = np.where(
+            normalized < 0.5,
+            _POW_LUT_11[indexes],
+            _POW_LUT_095[indexes]
+        )
+        final = min_scores + curved * (max_scores - min_scores)
+        return np.clip(
+            final.astype(np.int64), min_scores.astype(np.int64),
+            max_scores.astype(np.int64)
+        )
+
+    # HELPER METHODS
+
+    def _get_score_rating(self, score):
+        """Get rating for a 0-100 factor score"""
+        return _RATING_LABELS[bisect.bisect_right(_RATING_THRESHOLDS, score)]
+
+    def _get_score_grade(self, cibil_score):
+        """Get grade for a CIBIL-scale score"""
+        return _GRADE_LABELS[
+            bisect.bisect_right(_GRADE_THRESHOLDS, cibil_score)]
+
+
+_EMPTY_PROFILE_RESULT = UserInputCibilCalculator({
+    field: 0 for field in UserInputCibilCalculator._REQUIRED_FIELDS
+}).calculate_cibil_score()
@@ -1,41 +1,108 @@
+import hashlib
+import io
+import json
+import uuid
+
 from rest_framework import status, generics
 from rest_framework.decorators import api_view, permission_classes
+from rest_framework.pagination import PageNumberPagination
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from django.shortcuts import get_object_or_404
-from django.db import transaction
-from datetime import datetime, timedelta
+from django.core.cache import cache
+from django.urls import reverse
+from django.db import connection, transaction
+from django.utils import timezone
+from django.db.models import Count, ExpressionWrapper, F, FloatField, Prefetch, Sum
+from django.db.models.functions import NullIf
 from .models import (
     Customer, BankAccount, CreditCard, Loan, 
     PaymentHistory, CibilScore, CibilReport
 )
 from .serializers import (
-    CustomerSerializer, CibilScoreSerializer, CibilReportSerializer,
-    CibilScoreRequestSerializer, BankAccountSerializer,
-    CreditCardSerializer, LoanSerializer, PaymentHistorySerializer
+    CustomerSerializer, CustomerListSerializer, CibilScoreSerializer,
+    CibilScoreHistorySerializer, CibilScoreRequestSerializer,
+    BankAccountSerializer, CreditCardSerializer, LoanSerializer,
+    PaymentHistorySerializer
+)
+from .tasks import (
+    build_dynamic_score_response, get_cibil_grade, process_cibil_score_task
 )
-from .cibil_calculator import DynamicCibilScoreCalculator
+
+_VALID_FACTORS = ['payment_history', 'credit_utilization',
+                  'credit_history_length', 'credit_mix', 'new_credit']
+
+
+def _validate_custom_weights(custom_weights):
+    """
+    Check factor names and weight values; returns an error message for
+    invalid input, None when the weights are usable.
+    """
+    try:
+        for factor, weight in custom_weights.items():
+            if factor not in _VALID_FACTORS:
+                return (f'Invalid factor: {factor}. '
+                        f'Valid factors are: {_VALID_FACTORS}')
+            weight_value = float(weight)
+            if weight_value < 0 or weight_value > 100:
+                return f'Weight for {factor} must be between 0 and 100'
+    except (ValueError, TypeError):
+        return 'Weights must be numeric values'
+    return None
+
+
+def _customer_queryset():
+    """
+    Customers with everything CustomerSerializer renders prefetched, so
+    list/detail requests cost a fixed number of queries instead of five
+    extra per customer.
+    """
+    return Customer.objects.prefetch_related(
+        'bank_accounts', 'credit_cards', 'loans',
+        Prefetch(
+            'cibil_scores',
+            queryset=CibilScore.objects.filter(is_latest=True),
+            to_attr='_latest_cibil_scores'
+        )
+    )
 
 
 class CustomerViewSet(generics.ListCreateAPIView):
     """
     List all customers or create a new customer.
     """
-    queryset = Customer.objects.all()
     serializer_class = CustomerSerializer
     permission_classes = [AllowAny]
 
+    def get_serializer_class(self):
+        # List rows use the lean summary shape; create keeps the full
+        # serializer
+        if self.request.method == 'GET':
+            return CustomerListSerializer
+        return CustomerSerializer
+
+    def get_queryset(self):
+        if self.request.method == 'GET':
+            return Customer.objects.annotate(
+                bank_account_count=Count('bank_accounts', distinct=True),
+                credit_card_count=Count('credit_cards', distinct=True),
+                loan_count=Count('loans', distinct=True),
+            )
+        return _customer_queryset()
+
 
 class CustomerDetailView(generics.RetrieveUpdateDestroyAPIView):
     """
     Retrieve, update or delete a customer by PAN card number.
     """
-    queryset = Customer.objects.all()
     serializer_class = CustomerSerializer
     lookup_field = 'pan_card_number'
     permission_classes = [AllowAny]
 
+    def get_queryset(self):
+        return _customer_queryset()
+
 
 class CheckDynamicCibilScoreView(APIView):
     """
@@ -59,84 +126,31 @@ class CheckDynamicCibilScoreView(APIView):
             
             # Validate custom weights format
             if custom_weights:
-                try:
-                    # Validate that weights are numeric and reasonable
-                    valid_factors = ['payment_history', 'credit_utilization', 'credit_history_length', 'credit_mix', 'new_credit']
-                    
-                    for factor, weight in custom_weights.items():
-                        if factor not in valid_factors:
-                            return Response(
-                                {'error': f'Invalid factor: {factor}. Valid factors are: {valid_factors}'},
-                                status=status.HTTP_400_BAD_REQUEST
-                            )
-                        
-                        weight_value = float(weight)
-                        if weight_value < 0 or weight_value > 100:
-                            return Response(
-                                {'error': f'Weight for {factor} must be between 0 and 100'},
-                                status=status.HTTP_400_BAD_REQUEST
-                            )
-                            
-                except (ValueError, TypeError):
+                weights_error = _validate_custom_weights(custom_weights)
+                if weights_error is not None:
                     return Response(
-                        {'error': 'Weights must be numeric values'},
+                        {'error': weights_error},
                         status=status.HTTP_400_BAD_REQUEST
                     )
-            
-            # Get customer
-            customer = get_object_or_404(Customer, pan_card_number=pan_card_number)
 
-            # Create calculator with custom weights
-            calculator = DynamicCibilScoreCalculator(customer, custom_weights)
-            
-            # Calculate dynamic CIBIL score
-            new_score, calculation_details = calculator.calculate_dynamic_cibil_score(commit=False)
-            new_score.customer = customer
-            new_score.is_latest = True
-
-            with transaction.atomic():
-                # Mark all existing scores as not latest
-                CibilScore.objects.filter(customer=customer, is_latest=True).update(is_latest=False)
-                
-                # Save the new score
-                new_score.save()
-
-            # Get comprehensive breakdown
-            comprehensive_breakdown = calculator.get_comprehensive_score_breakdown()
-            
-            # Prepare response
-            response_data = {
-                'pan_card_number': pan_card_number,
-                'customer': {
-                    'full_name': customer.full_name,
-                    'email': customer.email,
-                    'phone': customer.phone_number,
-                    'pan_card_number': customer.pan_card_number
-                },
-                'cibil_score_summary': {
-                    'final_score': comprehensive_breakdown['final_cibil_score'],
-                    'base_score': comprehensive_breakdown['base_cibil_score'],
-                    'score_range': {
-                        'minimum_possible': comprehensive_breakdown['dynamic_range']['min_score'],
-                        'maximum_possible': comprehensive_breakdown['dynamic_range']['max_score'],
-                        'range_width': comprehensive_breakdown['dynamic_range']['range_width']
-                    },
-                    'score_grade': self.get_cibil_grade(comprehensive_breakdown['final_cibil_score']),
-                    'improvement_potential': comprehensive_breakdown['summary']['improvement_potential']
-                },
-                'weight_configuration': {
-                    'custom_weights_applied': bool(custom_weights),
-                    'weights_used': comprehensive_breakdown['custom_weights'],
-                    'weights_normalized': True
-                },
-                'detailed_breakdown': comprehensive_breakdown,
-                'calculation_metadata': {
-                    'calculation_date': new_score.score_date.isoformat(),
-                    'dynamic_range_applied': True,
-                    'behavioral_adjustments_applied': True,
-                    'algorithm_version': '2.0_dynamic'
-                }
-            }
+            # Serve repeat requests from cache: same PAN and weights
+            # within the TTL return the previously built body without
+            # recomputing or reserializing the score
+            weights_digest = hashlib.blake2b(
+                json.dumps(custom_weights, sort_keys=True).encode(),
+                digest_size=8
+            ).hexdigest()
+            cache_key = f"cibil:{pan_card_number}:{weights_digest}"
+            cached_body = cache.get(cache_key)
+            if cached_body is not None:
+                return Response(cached_body, status=status.HTTP_200_OK)
+
+            # Calculate, persist and build the full response body (shared
+            # with the Celery task)
+            response_data = build_dynamic_score_response(
+                pan_card_number, custom_weights)
+
+            cache.set(cache_key, response_data, 60)
 
             return Response(response_data, status=status.HTTP_200_OK)
 
@@ -153,24 +167,7 @@ class CheckDynamicCibilScoreView(APIView):
     
     def get_cibil_grade(self, score):
         """Convert CIBIL score to letter grade"""
-        if score >= 800:
-            return "A+"
-        elif score >= 750:
-            return "A"
-        elif score >= 700:
-            return "B+"
-        elif score >= 650:
-            return "B"
-        elif score >= 600:
-            return "C+"
-        elif score >= 550:
-            return "C"
-        elif score >= 500:
-            return "D+"
-        elif score >= 450:
-            return "D"
-        else:
-            return "F"
+        return get_cibil_grade(score)
 
 
 class CheckCibilScoreView(APIView):
@@ -178,13 +175,62 @@ class CheckCibilScoreView(APIView):
     Original endpoint - redirects to dynamic calculation with default weights
     """
     permission_classes = [AllowAny]
-    
+
     def post(self, request):
         # Create an instance of CheckDynamicCibilScoreView and call its post method
         dynamic_view = CheckDynamicCibilScoreView()
         return dynamic_view.post(request)
 
 
+class CheckDynamicCibilScoreAsyncView(APIView):
+    """
+    Queue the dynamic score calculation on Celery instead of running it
+    in the request. Returns 202 with a task id; clients poll the status
+    endpoint for the result.
+    """
+    permission_classes = [AllowAny]
+
+    def post(self, request):
+        pan_card_number = request.data.get('pan_card_number')
+        custom_weights = request.data.get('custom_weights', {})
+
+        if not pan_card_number:
+            return Response(
+                {'error': 'PAN card number is required'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if custom_weights:
+            weights_error = _validate_custom_weights(custom_weights)
+            if weights_error is not None:
+                return Response(
+                    {'error': weights_error},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+        result = process_cibil_score_task.delay(pan_card_number, custom_weights)
+        return Response({
+            'task_id': result.id,
+            'status': 'queued',
+            'status_url': reverse('cibil_score_task_status', args=[result.id]),
+        }, status=status.HTTP_202_ACCEPTED)
+
+
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def get_cibil_score_task_status(request, task_id):
+    """
+    Poll the outcome of a queued score calculation by task id
+    """
+    entry = cache.get(f"cibil:task:{task_id}")
+    if entry is None:
+        # Not finished (or the result TTL expired)
+        return Response(
+            {'task_id': task_id, 'status': 'pending'},
+            status=status.HTTP_202_ACCEPTED
+        )
+    return Response({'task_id': task_id, **entry}, status=status.HTTP_200_OK)
+
+
 @api_view(['GET'])
 @permission_classes([AllowAny])
 def get_cibil_history(request, pan_card_number):
@@ -193,14 +239,21 @@ def get_cibil_history(request, pan_card_number):
     """
     try:
         customer = get_object_or_404(Customer, pan_card_number=pan_card_number)
-        cibil_scores = CibilScore.objects.filter(customer=customer).order_by('-score_date')
-        
-        serializer = CibilScoreSerializer(cibil_scores, many=True)
-        return Response({
-            'customer': customer.full_name,
-            'pan_card_number': pan_card_number,
-            'score_history': serializer.data
-        }, status=status.HTTP_200_OK)
+        # Select only the columns the history rows render
+        cibil_scores = CibilScore.objects.filter(customer=customer).only(
+            'id', 'score', 'score_date', 'is_latest',
+            'payment_history_score', 'credit_utilization_score'
+        ).order_by('-score_date')
+
+        # Paginate so long-lived customers don't return their entire
+        # score history in one response
+        paginator = PageNumberPagination()
+        page = paginator.paginate_queryset(cibil_scores, request)
+        serializer = CibilScoreHistorySerializer(page, many=True)
+        response = paginator.get_paginated_response(serializer.data)
+        response.data['customer'] = customer.full_name
+        response.data['pan_card_number'] = pan_card_number
+        return response
         
     except Customer.DoesNotExist:
         return Response(
@@ -219,8 +272,9 @@ class BankAccountViewSet(generics.ListCreateAPIView):
     def get_queryset(self):
         pan_card_number = self.kwargs.get('pan_card_number')
         if pan_card_number:
-            customer = get_object_or_404(Customer, pan_card_number=pan_card_number)
-            return BankAccount.objects.filter(customer=customer)
+            # One indexed join instead of a customer lookup plus filter
+            return BankAccount.objects.filter(
+                customer__pan_card_number=pan_card_number)
         return BankAccount.objects.all()
 
 
@@ -232,11 +286,18 @@ class CreditCardViewSet(generics.ListCreateAPIView):
     permission_classes = [AllowAny]
     
     def get_queryset(self):
+        # Utilization computed in SQL per row; the serializer picks up
+        # the annotation instead of dividing in Python
+        utilization = ExpressionWrapper(
+            F('current_balance') * 100.0 / NullIf(F('credit_limit'), 0),
+            output_field=FloatField()
+        )
         pan_card_number = self.kwargs.get('pan_card_number')
         if pan_card_number:
-            customer = get_object_or_404(Customer, pan_card_number=pan_card_number)
-            return CreditCard.objects.filter(customer=customer)
-        return CreditCard.objects.all()
+            return CreditCard.objects.filter(
+                customer__pan_card_number=pan_card_number
+            ).annotate(utilization=utilization)
+        return CreditCard.objects.annotate(utilization=utilization)
 
 
 class LoanViewSet(generics.ListCreateAPIView):
@@ -249,8 +310,8 @@ class LoanViewSet(generics.ListCreateAPIView):
     def get_queryset(self):
         pan_card_number = self.kwargs.get('pan_card_number')
         if pan_card_number:
-            customer = get_object_or_404(Customer, pan_card_number=pan_card_number)
-            return Loan.objects.filter(customer=customer)
+            return Loan.objects.filter(
+                customer__pan_card_number=pan_card_number)
         return Loan.objects.all()
 
 
@@ -264,11 +325,65 @@ class PaymentHistoryViewSet(generics.ListCreateAPIView):
     def get_queryset(self):
         pan_card_number = self.kwargs.get('pan_card_number')
         if pan_card_number:
-            customer = get_object_or_404(Customer, pan_card_number=pan_card_number)
-            return PaymentHistory.objects.filter(customer=customer).order_by('-due_date')
+            return PaymentHistory.objects.filter(
+                customer__pan_card_number=pan_card_number
+            ).order_by('-due_date')
         return PaymentHistory.objects.all()
 
 
+# Past this row count, payment imports on Postgres go through COPY
+# instead of multi-row INSERTs
+_COPY_THRESHOLD = 500
+
+
+def _copy_payment_history(customer, payment_rows):
+    """
+    Stream payment rows into payment_history with Postgres COPY, which
+    skips per-row statement parsing and is the fastest bulk-ingest path.
+    Callers must check connection.vendor first.
+    """
+    columns = (
+        'id', 'customer_id', 'loan_id', 'credit_card_id', 'payment_type',
+        'due_date', 'payment_date', 'due_amount', 'paid_amount',
+        'payment_status', 'days_late', 'created_at'
+    )
+    created_at = timezone.now().isoformat()
+
+    def field(value):
+        # COPY text format: \N is NULL, and backslash/tab/newline in the
+        # data must be escaped or they shift columns. Escaping backslash
+        # first also keeps a literal "\N" from reading back as NULL.
+        if value in (None, ''):
+            return r'\N'
+        return (str(value)
+                .replace('\\', '\\\\')
+                .replace('\t', '\\t')
+                .replace('\n', '\\n')
+                .replace('\r', '\\r'))
+
+    buffer = io.StringIO()
+    for data in payment_rows:
+        buffer.write('\t'.join((
+            str(uuid.uuid4()),
+            str(customer.pk),
+            field(data.get('loan')),
+            field(data.get('credit_card')),
+            field(data['payment_type']),
+            field(data['due_date']),
+            field(data.get('payment_date')),
+            field(data['due_amount']),
+            field(data.get('paid_amount', 0)),
+            field(data['payment_status']),
+            field(data.get('days_late', 0)),
+            created_at,
+        )))
+        buffer.write('\n')
+    buffer.seek(0)
+
+    with connection.cursor() as cursor:
+        cursor.copy_from(buffer, 'payment_history', columns=columns)
+
+
 @api_view(['POST'])
 @permission_classes([AllowAny])
 def add_customer_data(request):
@@ -296,25 +411,36 @@ def add_customer_data(request):
                 defaults=customer_data
             )
             
-            # Add bank accounts
-            for account_data in bank_accounts:
-                account_data['customer'] = customer.id
-                BankAccount.objects.create(**account_data)
-            
-            # Add credit cards
-            for card_data in credit_cards:
-                card_data['customer'] = customer.id
-                CreditCard.objects.create(**card_data)
-            
-            # Add loans
-            for loan_data in loans:
-                loan_data['customer'] = customer.id
-                Loan.objects.create(**loan_data)
-            
-            # Add payment history
-            for payment_data in payment_history:
-                payment_data['customer'] = customer.id
-                PaymentHistory.objects.create(**payment_data)
+            # Batch the inserts: one multi-row INSERT per model instead
+            # of one round trip per item (and no mutation of the caller's
+            # dicts)
+            if bank_accounts:
+                BankAccount.objects.bulk_create(
+                    [BankAccount(customer=customer, **data)
+                     for data in bank_accounts],
+                    batch_size=500
+                )
+            if credit_cards:
+                CreditCard.objects.bulk_create(
+                    [CreditCard(customer=customer, **data)
+                     for data in credit_cards],
+                    batch_size=500
+                )
+            if loans:
+                Loan.objects.bulk_create(
+                    [Loan(customer=customer, **data) for data in loans],
+                    batch_size=500
+                )
+            if payment_history:
+                if (connection.vendor == 'postgresql'
+                        and len(payment_history) >= _COPY_THRESHOLD):
+                    _copy_payment_history(customer, payment_history)
+                else:
+                    PaymentHistory.objects.bulk_create(
+                        [PaymentHistory(customer=customer, **data)
+                         for data in payment_history],
+                        batch_size=500
+                    )
             
             return Response({
                 'message': 'Customer data added successfully',
@@ -335,34 +461,54 @@ def customer_dashboard(request, pan_card_number):
     Get complete customer dashboard with all financial information
     """
     try:
-        customer = get_object_or_404(Customer, pan_card_number=pan_card_number)
-        
-        # Get all related data
-        bank_accounts = BankAccount.objects.filter(customer=customer)
-        credit_cards = CreditCard.objects.filter(customer=customer)
-        loans = Loan.objects.filter(customer=customer)
-        payment_history = PaymentHistory.objects.filter(customer=customer).order_by('-due_date')[:10]
-        latest_cibil_score = CibilScore.objects.filter(customer=customer, is_latest=True).first()
-        
-        # Calculate summary statistics
-        total_credit_limit = sum(card.credit_limit for card in credit_cards if card.is_active)
-        total_credit_used = sum(card.current_balance for card in credit_cards if card.is_active)
-        total_loan_outstanding = sum(loan.outstanding_amount for loan in loans if loan.status == 'ACTIVE')
-        
+        # One prefetched fetch serves both the dashboard lists and the
+        # nested CustomerSerializer, which previously re-queried the
+        # same relations a second time
+        customer = get_object_or_404(
+            _customer_queryset(), pan_card_number=pan_card_number)
+
+        bank_accounts = customer.bank_accounts.all()
+        credit_cards = customer.credit_cards.all()
+        loans = customer.loans.all()
+        # Prefetch querysets cannot be sliced on this Django version, so
+        # recent payments stay a separate limited query
+        payment_history = PaymentHistory.objects.filter(
+            customer=customer).order_by('-due_date')[:10]
+        latest_scores = customer._latest_cibil_scores
+        latest_cibil_score = latest_scores[0] if latest_scores else None
+
+        # Summary statistics aggregated in SQL instead of summing and
+        # counting rows in Python
+        card_stats = CreditCard.objects.filter(
+            customer=customer, is_active=True).aggregate(
+            total_limit=Sum('credit_limit'),
+            total_balance=Sum('current_balance'),
+            active_count=Count('id')
+        )
+        loan_stats = Loan.objects.filter(
+            customer=customer, status='ACTIVE').aggregate(
+            outstanding=Sum('outstanding_amount'),
+            active_count=Count('id')
+        )
+
+        total_credit_limit = float(card_stats['total_limit'] or 0)
+        total_credit_used = float(card_stats['total_balance'] or 0)
+        total_loan_outstanding = float(loan_stats['outstanding'] or 0)
+
         utilization_ratio = 0
         if total_credit_limit > 0:
             utilization_ratio = (total_credit_used / total_credit_limit) * 100
-        
+
         dashboard_data = {
             'customer': CustomerSerializer(customer).data,
             'summary': {
-                'total_bank_accounts': bank_accounts.count(),
-                'active_credit_cards': credit_cards.filter(is_active=True).count(),
-                'active_loans': loans.filter(status='ACTIVE').count(),
-                'total_credit_limit': float(total_credit_limit),
-                'total_credit_used': float(total_credit_used),
+                'total_bank_accounts': len(bank_accounts),
+                'active_credit_cards': card_stats['active_count'],
+                'active_loans': loan_stats['active_count'],
+                'total_credit_limit': total_credit_limit,
+                'total_credit_used': total_credit_used,
                 'credit_utilization_ratio': round(utilization_ratio, 2),
-                'total_loan_outstanding': float(total_loan_outstanding),
+                'total_loan_outstanding': total_loan_outstanding,
             },
             'bank_accounts': BankAccountSerializer(bank_accounts, many=True).data,
             'credit_cards': CreditCardSerializer(credit_cards, many=True).data,
@@ -380,6 +526,30 @@ def customer_dashboard(request, pan_card_number):
         )
 
 
+# Report body template, built once; interior indentation matches the
+# previous f-string output exactly
+_REPORT_TEMPLATE = "\n".join([
+    "CIBIL Score Report for {name}",
+    "    PAN: {pan}",
+    "    Score: {score} ({category})",
+    "    Report Date: {report_date}",
+    "    ",
+    "    Score Breakdown:",
+    "    - Payment History: {payment_history}% (Weight: 35%)",
+    "    - Credit Utilization: {credit_utilization}% (Weight: 30%)",
+    "    - Credit History Length: {credit_history_length}% (Weight: 15%)",
+    "    - Credit Mix: {credit_mix}% (Weight: 10%)",
+    "    - New Credit: {new_credit}% (Weight: 10%)",
+    "    ",
+    "    Account Summary:",
+    "    - Total Accounts: {total_accounts}",
+    "    - Active Accounts: {active_accounts}",
+    "    - Total Credit Limit: \u20b9{total_credit_limit:,.2f}",
+    "    - Total Outstanding: \u20b9{total_outstanding:,.2f}",
+    "    - Credit Utilization: {credit_utilization_ratio}%",
+])
+
+
 def generate_cibil_report(cibil_score):
     """
     Generate detailed CIBIL report based on score
@@ -388,26 +558,23 @@ def generate_cibil_report(cibil_score):
     score = cibil_score.score
     
     # Generate report summary
-    summary = f"""
-    CIBIL Score Report for {customer.full_name}
-    PAN: {customer.pan_card_number}
-    Score: {score} ({cibil_score.get_score_category()})
-    Report Date: {cibil_score.score_date.strftime('%Y-%m-%d')}
-    
-    Score Breakdown:
-    - Payment History: {cibil_score.payment_history_score}% (Weight: 35%)
-    - Credit Utilization: {cibil_score.credit_utilization_score}% (Weight: 30%)
-    - Credit History Length: {cibil_score.credit_history_length_score}% (Weight: 15%)
-    - Credit Mix: {cibil_score.credit_mix_score}% (Weight: 10%)
-    - New Credit: {cibil_score.new_credit_score}% (Weight: 10%)
-    
-    Account Summary:
-    - Total Accounts: {cibil_score.total_accounts}
-    - Active Accounts: {cibil_score.active_accounts}
-    - Total Credit Limit: ₹{cibil_score.total_credit_limit:,.2f}
-    - Total Outstanding: ₹{cibil_score.total_outstanding:,.2f}
-    - Credit Utilization: {cibil_score.credit_utilization_ratio}%
-    """
+    summary = _REPORT_TEMPLATE.format(
+        name=customer.full_name,
+        pan=customer.pan_card_number,
+        score=score,
+        category=cibil_score.get_score_category(),
+        report_date=cibil_score.score_date.strftime('%Y-%m-%d'),
+        payment_history=cibil_score.payment_history_score,
+        credit_utilization=cibil_score.credit_utilization_score,
+        credit_history_length=cibil_score.credit_history_length_score,
+        credit_mix=cibil_score.credit_mix_score,
+        new_credit=cibil_score.new_credit_score,
+        total_accounts=cibil_score.total_accounts,
+        active_accounts=cibil_score.active_accounts,
+        total_credit_limit=cibil_score.total_credit_limit,
+        total_outstanding=cibil_score.total_outstanding,
+        credit_utilization_ratio=cibil_score.credit_utilization_ratio,
+    )
     
     # Generate recommendations
     recommendations = []
@@ -436,7 +603,7 @@ def generate_cibil_report(cibil_score):
     report = CibilReport.objects.create(
         customer=customer,
         cibil_score=cibil_score,
-        report_summary=summary.strip(),
+        report_summary=summary,
         recommendations="; ".join(recommendations),
         risk_factors="; ".join(risk_factors),
         positive_factors="; ".join(positive_factors)
@@ -0,0 +1,9 @@
+import os
+
+from celery import Celery
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'score_checker.settings')
+
+app = Celery('score_checker')
+app.config_from_object('django.conf:settings', namespace='CELERY')
+app.autodiscover_tasks()
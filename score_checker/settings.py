@@ -148,7 +148,7 @@ REST_FRAMEWORK = {
         'rest_framework.permissions.AllowAny',  # Changed for development
     ],
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'main_app.renderers.ORJSONRenderer',  # orjson-backed JSON encoding
         'rest_framework.renderers.BrowsableAPIRenderer',
     ],
     'DEFAULT_PARSER_CLASSES': [
@@ -160,6 +160,21 @@ REST_FRAMEWORK = {
     'PAGE_SIZE': 20,
 }
 
+# Cache - shared between web workers and Celery workers so queued task
+# results can be polled from any process
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.environ.get('REDIS_URL', 'redis://localhost:6379/1'),
+    }
+}
+
+# Celery task queue
+CELERY_BROKER_URL = os.environ.get('CELERY_BROKER_URL', 'redis://localhost:6379/0')
+CELERY_TASK_SERIALIZER = 'json'
+CELERY_ACCEPT_CONTENT = ['json']
+CELERY_TIMEZONE = TIME_ZONE
+
 # CORS settings
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:3000",